@@ -23,6 +23,7 @@
 #===============================================================================
 
 import nuke
+import json
 
 #===============================================================================
 #                       ---- Scripts ----
@@ -56,14 +57,14 @@ def copy_paste_reconnect(mode='copy'):
             node.addKnob(copied_list_knob)
             node[COPIED_NODES_KNOB_NAME].setValue(copied_nodes_string)
             
-            connection_info = {}
+            connection_info = []
             for i in range(node.inputs()):
                 input_node = node.input(i)
                 if input_node and input_node.name() not in copied_node_names:
-                    connection_info[i] = input_node.name()
+                    connection_info.append((i, input_node.name()))
 
             if connection_info:
-                data_string = ";".join(["%s:%s" % (index, name) for index, name in connection_info.items()])
+                data_string = json.dumps(connection_info, separators=(',', ':'))
                 connections_knob = nuke.String_Knob(CONNECTIONS_KNOB_NAME, 'Temp Connections')
                 node.addKnob(connections_knob)
                 node[CONNECTIONS_KNOB_NAME].setValue(data_string)
@@ -87,22 +88,15 @@ def copy_paste_reconnect(mode='copy'):
         for node in nodes:
             if CONNECTIONS_KNOB_NAME in node.knobs():
                 data_string = node[CONNECTIONS_KNOB_NAME].value()
-                connections = data_string.split(';')
-                
-                for conn in connections:
-                    if ':' in conn:
-                        try:
-                            index_str, node_name = conn.split(':')
-                            input_index = int(index_str)
-                            target_node = nuke.toNode(node_name)
-                            
-                            if target_node:
-                                node.setInput(input_index, target_node)
-                            else:
-                                pass
-                                
-                        except:
-                            pass
+                try:
+                    connections = json.loads(data_string)
+                except ValueError:
+                    connections = []
+
+                for input_index, node_name in connections:
+                    target_node = nuke.toNode(node_name)
+                    if target_node:
+                        node.setInput(int(input_index), target_node)
 
             # --- [ Clean Up ] ---
             for knob_name in [CONNECTIONS_KNOB_NAME, COPIED_NODES_KNOB_NAME, TEMP_TAB_NAME]:
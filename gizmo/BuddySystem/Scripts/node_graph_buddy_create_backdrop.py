@@ -94,8 +94,14 @@ class CreateBackdropPanel(nukescripts.PythonPanel):
         for knob in [self.presetsKnob, self.labelKnob, self.paddingKnob, self.fontSizeKnob, self.zOrderKnob, self.randomColorKnob, self.colorKnob, self.appearanceKnob, self.bookmarkKnob]:
             knob.setFlag(nuke.STARTLINE)
 
+        self.reset()
+
+    def reset(self):
+        """Restores the panel defaults so a cached panel opens in a clean state"""
         # --- [ Set panel defaults ] ---
         self.presetsKnob.setValue('None')
+        self.labelKnob.setEnabled(True)
+        self.randomColorKnob.setEnabled(True)
         self.labelKnob.setValue("")
         self.paddingKnob.setValue(100)
         self.fontSizeKnob.setValue(42)
@@ -149,24 +155,27 @@ def _calculate_z_order(nodes, padding=100):
 
     overlapping_bds = []
     for bd in nuke.allNodes('BackdropNode'):
-        bd_x_min, bd_y_min = bd.xpos(), bd.ypos()
+        # --- [ Reject on the cheap position reads before touching the size knobs ] ---
+        bd_x_min = bd.xpos()
+        if bd_x_min >= new_x_max:
+            continue
+        bd_y_min = bd.ypos()
+        if bd_y_min >= new_y_max:
+            continue
         bd_x_max = bd_x_min + bd.knob('bdwidth').value()
+        if bd_x_max <= new_x_min:
+            continue
         bd_y_max = bd_y_min + bd.knob('bdheight').value()
-        
-        if (new_x_min < bd_x_max and new_x_max > bd_x_min and
-            new_y_min < bd_y_max and new_y_max > bd_y_min):
-            overlapping_bds.append(bd)
+        if bd_y_max <= new_y_min:
+            continue
+        overlapping_bds.append((bd, bd_x_min, bd_y_min, bd_x_max, bd_y_max))
     
     if not overlapping_bds:
         return 0
     
     contained_bds = []
     other_overlapping_bds = []
-    for bd in overlapping_bds:
-        bd_x_min, bd_y_min = bd.xpos(), bd.ypos()
-        bd_x_max = bd_x_min + bd.knob('bdwidth').value()
-        bd_y_max = bd_y_min + bd.knob('bdheight').value()
-
+    for bd, bd_x_min, bd_y_min, bd_x_max, bd_y_max in overlapping_bds:
         if (new_x_min <= bd_x_min and new_y_min <= bd_y_min and
             new_x_max >= bd_x_max and new_y_max >= bd_y_max):
             contained_bds.append(bd)
@@ -187,9 +196,21 @@ def _calculate_z_order(nodes, padding=100):
         return (floor_z + ceiling_z) // 2
 
 
+_panel_singleton = None
+
+def _get_panel():
+    """Returns the shared CreateBackdropPanel, building it on first use and resetting it after"""
+    global _panel_singleton
+    if _panel_singleton is None:
+        _panel_singleton = CreateBackdropPanel()
+    else:
+        _panel_singleton.reset()
+    return _panel_singleton
+
+
 def _apply_panel_values(nodes):
     """Helper to show the panel and create a BackdropNode"""
-    panel = CreateBackdropPanel()
+    panel = _get_panel()
     default_z_order = _calculate_z_order(nodes, panel.paddingKnob.value())
     panel.zOrderKnob.setValue(int(default_z_order))
 
@@ -31,6 +31,8 @@ import math
 # --- [ Helper Class ] ---
 class NodeCluster(object):
     """A helper class to treat a group of connected nodes as a single entity"""
+    __slots__ = ('nodes', '_x', '_y', '_width', '_height', 'rel_positions')
+
     def __init__(self, nodes):
         self.nodes = nodes if nodes else []
         self._x = 0; self._y = 0; self._width = 0; self._height = 0
@@ -144,7 +146,8 @@ def auto_distribute_nodes(align=False, process_clusters=False):
     
     child_map, nodes_to_process, process_mode = {}, [], 'nodes'
 
-    selected_backdrops = [n for n in all_raw_nodes if n.Class() == 'BackdropNode']
+    classes = [n.Class() for n in all_raw_nodes]
+    selected_backdrops = [n for n, c in zip(all_raw_nodes, classes) if c == 'BackdropNode']
 
     if selected_backdrops:
         process_mode = 'backdrops'
@@ -208,7 +211,7 @@ def auto_distribute_nodes(align=False, process_clusters=False):
                     gap_size = float(gap_space) / num_gaps if num_gaps > 0 else 0
                     curr_x = float(l_b) + gap_size
                     for node in nodes_dist:
-                        node.setXpos(int(round(curr_x))); node.setYpos(node.ypos())
+                        node.setXpos(int(round(curr_x)))
                         if process_mode == 'backdrops': move_children(node, child_map)
                         curr_x += node.screenWidth() + gap_size
             except Exception as e: nuke.error("Error: {}".format(e))
@@ -238,7 +241,7 @@ def auto_distribute_nodes(align=False, process_clusters=False):
                     gap_size = float(gap_space) / num_gaps if num_gaps > 0 else 0
                     curr_y = float(t_b) + gap_size
                     for node in nodes_dist:
-                        node.setYpos(int(round(curr_y))); node.setXpos(node.xpos())
+                        node.setYpos(int(round(curr_y)))
                         if process_mode == 'backdrops': move_children(node, child_map)
                         curr_y += node.screenHeight() + gap_size
             except Exception as e: nuke.error("Error: {}".format(e))
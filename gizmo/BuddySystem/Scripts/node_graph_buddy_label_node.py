@@ -24,26 +24,34 @@
 
 import nuke
 
-# --- [  Import PySide based on nuke version ] --- 
-if nuke.NUKE_VERSION_MAJOR < 11:
-    from PySide import QtCore
-elif nuke.NUKE_VERSION_MAJOR < 16:
-    from PySide2 import QtCore
-else:
-    from PySide6 import QtCore
-    
+_QtCore = None
+
+# --- [  Classes that don't need to be recentered ] ---
+EXCLUDED_CLASSES = frozenset(('BackdropNode', 'StickyNote', 'Camera2', 'Axis2', 'Read', 'Constant', 'CheckerBoard2', 'ColorBars', 'ColorWheel', 'Dot'))
+
 #===============================================================================
 #                       ---- Scripts ----
 #===============================================================================  
 
+def _qtcore():
+    """Imports QtCore for the running nuke version on first use and caches it"""
+    global _QtCore
+    if _QtCore is None:
+        # --- [  Import PySide based on nuke version ] --- 
+        if nuke.NUKE_VERSION_MAJOR < 11:
+            from PySide import QtCore
+        elif nuke.NUKE_VERSION_MAJOR < 16:
+            from PySide2 import QtCore
+        else:
+            from PySide6 import QtCore
+        _QtCore = QtCore
+    return _QtCore
+
 def label_and_recenter_nodes(auto_case=True):
     """
     Applies a user label to selected nodes and recenters them vertically
     Optional argument of 'auto_case' can be used to auto uppercase the first letter in the label
     """
-    # --- [  Classes that don't need to be recentered ] ---
-    EXCLUDED_CLASSES = ['BackdropNode', 'StickyNote', 'Camera2', 'Axis2', 'Read', 'Constant', 'CheckerBoard2', 'ColorBars', 'ColorWheel', 'Dot']
-
     nodes = nuke.selectedNodes()
     if not nodes:
         nuke.message("Please select at least one node to relabel.")
@@ -75,26 +83,29 @@ def label_and_recenter_nodes(auto_case=True):
         new_label = new_label[0].upper() + new_label[1:]
 
     nodes_to_recenter_info = []
-    
-    undo = nuke.Undo()
-    undo.begin("Relabel and Recenter Nodes")
+    _append = nodes_to_recenter_info.append
 
     # --- [ Apply label and record original size ] ---
-    for node in nodes:
-        should_recenter_node = (recenter and
-                                node.Class() not in EXCLUDED_CLASSES)
+    with nuke.Undo("Relabel Nodes"):
+        for node in nodes:
+            # --- [ Nothing to apply or recenter if the label is already set ] ---
+            if node['label'].value() == new_label:
+                continue
+
+            node_class = node.Class()
+            should_recenter_node = (recenter and
+                                    node_class not in EXCLUDED_CLASSES)
 
-        if should_recenter_node:
-            nodes_to_recenter_info.append({
-                'node': node,
-                'old_y': node.ypos(),
-                'old_h': node.screenHeight()
-            })
+            if should_recenter_node:
+                _append({
+                    'node': node,
+                    'old_y': node.ypos(),
+                    'old_h': node.screenHeight()
+                })
 
-        node['label'].setValue(new_label)
+            node['label'].setValue(new_label)
 
     if not nodes_to_recenter_info:
-        undo.end()
         return
 
     def calculate_difference_and_recenter():
@@ -102,22 +113,23 @@ def label_and_recenter_nodes(auto_case=True):
         This function performs the recenter 
         Due to nukes GUI not updating fast enough, it must be run after a forced delay
         The delay allows the label to be applied, and the node size to change, so the script can adjust correctly
+        Runs in its own undo block, so an open undo is never left waiting on the timer
         """
-        for geo_info in nodes_to_recenter_info:
-            node = geo_info['node']
-            old_y = geo_info['old_y']
-            old_h = geo_info['old_h']
+        with nuke.Undo("Recenter Nodes"):
+            for geo_info in nodes_to_recenter_info:
+                node = geo_info['node']
+                old_y = geo_info['old_y']
+                old_h = geo_info['old_h']
 
-            new_h = node.screenHeight()
-
-            if old_h == new_h:
-                continue
+                new_h = node.screenHeight()
 
-            delta = (old_h - new_h) / 2.0
-            new_y_pos = int(round(old_y + delta))
-            node.setYpos(new_y_pos)
+                if old_h == new_h:
+                    continue
 
-        undo.end()
+                delta = (old_h - new_h) / 2.0
+                new_y_pos = int(round(old_y + delta))
+                node.setYpos(new_y_pos)
 
     # --- [ Delays the recenter here ] ---
+    QtCore = _qtcore()
     QtCore.QTimer.singleShot(50, calculate_difference_and_recenter)
\ No newline at end of file
@@ -27,18 +27,16 @@ import nuke
 #                       ---- Scripts ----
 #===============================================================================
 
-def get_center(node):
-    """Returns the center of a node"""
+def get_center(node, dims=None):
+    """Returns the center of a node, optionally using a precomputed (width, height)"""
     x = node.xpos()
     y = node.ypos()
-    w = node.screenWidth()
-    h = node.screenHeight()
+    w, h = dims if dims else (node.screenWidth(), node.screenHeight())
     return x + w/2.0, y + h/2.0
 
-def set_center(node, cx, cy):
-    """Move a node by its center point"""
-    w = node.screenWidth()
-    h = node.screenHeight()
+def set_center(node, cx, cy, dims=None):
+    """Move a node by its center point, optionally using a precomputed (width, height)"""
+    w, h = dims if dims else (node.screenWidth(), node.screenHeight())
     node.setXpos(int(cx - w/2.0))
     node.setYpos(int(cy - h/2.0))
 
@@ -50,20 +48,30 @@ def mirror_nodes(direction='horizontal'):
             return
 
         pivot = nuke.selectedNode()
+
+        # --- [ Split the selection once ] ---
+        mirrorable, backdrops = [], []
+        for n in sel:
+            if n.Class() == 'BackdropNode':
+                backdrops.append(n)
+            elif n != pivot:
+                mirrorable.append(n)
+
+        # --- [ Node sizes don't change while mirroring so read them once ] ---
+        dims = {n: (n.screenWidth(), n.screenHeight()) for n in mirrorable}
+
         pcx, pcy = get_center(pivot)
 
         # --- [ Mirror all nonbackdrop nodes ] ---
-        for n in sel:
-            if n == pivot or n.Class() == 'BackdropNode':
-                continue
-            cx, cy = get_center(n)
+        for n in mirrorable:
+            cx, cy = get_center(n, dims[n])
             if direction == 'horizontal':
-                set_center(n, 2*pcx - cx, cy)
+                set_center(n, 2*pcx - cx, cy, dims[n])
             else:
-                set_center(n, cx, 2*pcy - cy)
+                set_center(n, cx, 2*pcy - cy, dims[n])
 
         #  --- [ Mirror backdrops ] ---
-        for bd in [n for n in sel if n.Class() == 'BackdropNode']:
+        for bd in backdrops:
             x = bd.xpos()
             y = bd.ypos()
             w = bd['bdwidth'].value()
@@ -24,24 +24,33 @@
 
 import nuke
 import re
-from collections import defaultdict
+from collections import defaultdict, deque
 
 # --- [  Import PySide based on nuke version ] --- 
 if nuke.NUKE_VERSION_MAJOR < 11:
     from PySide.QtGui import (QWidget, QTreeWidget, QTreeWidgetItem, QHeaderView, QVBoxLayout, QHBoxLayout, 
-                              QPushButton, QLabel, QTableWidget, QTableWidgetItem, QAbstractItemView, QLineEdit,
-                              QTreeWidgetItemIterator)
-    from PySide.QtCore import Qt
+                              QPushButton, QLabel, QTableView, QAbstractItemView, QLineEdit)
+    from PySide.QtGui import QStandardItemModel, QStandardItem
+    from PySide.QtCore import Qt, QTimer
 elif nuke.NUKE_VERSION_MAJOR < 16:
     from PySide2.QtWidgets import (QWidget, QTreeWidget, QTreeWidgetItem, QHeaderView, QVBoxLayout, QHBoxLayout, 
-                                   QPushButton, QLabel, QTableWidget, QTableWidgetItem, QAbstractItemView, QLineEdit, 
-                                   QTreeWidgetItemIterator)
-    from PySide2.QtCore import Qt
+                                   QPushButton, QLabel, QTableView, QAbstractItemView, QLineEdit)
+    from PySide2.QtGui import QStandardItemModel, QStandardItem
+    from PySide2.QtCore import Qt, QTimer
 else:
     from PySide6.QtWidgets import (QWidget, QTreeWidget, QTreeWidgetItem, QHeaderView, QVBoxLayout, QHBoxLayout, 
-                                   QPushButton, QLabel, QTableWidget, QTableWidgetItem, QAbstractItemView, QLineEdit, 
-                                   QTreeWidgetItemIterator)
-    from PySide6.QtCore import Qt
+                                   QPushButton, QLabel, QTableView, QAbstractItemView, QLineEdit)
+    from PySide6.QtGui import QStandardItemModel, QStandardItem
+    from PySide6.QtCore import Qt, QTimer
+
+# --- [ Strips trailing digits/underscores so 'Blur1', 'Blur2' group together ] ---
+_SANITIZE_RE = re.compile(r'^(.*?)(?:[_0-9]+)?$')
+
+# --- [ Container classes that are counted by sanitized name ] ---
+_CONTAINER_CLASSES = frozenset(('Group', 'LiveGroup', 'Precomp'))
+
+# --- [ Whether a node class holds child nodes, filled in the first time each class is seen ] ---
+_HAS_CHILDREN_BY_CLASS = {'Group': True, 'LiveGroup': True}
 
 #===============================================================================
 #                       ---- Scripts ----
@@ -60,17 +69,35 @@ class NodeorietyPanel(QWidget):
         self.current_view = 'table'
         self.tables = []
 
+        # --- [ Lowercase text index used by the search filter ] ---
+        self._table_row_text = []
+        self._table_row_hidden = []
+        self._tree_index = []
+        self._tree_hidden = []
+
+        # --- [ One traversal of the script, shared by both views until refresh ] ---
+        self._node_snapshot = None
+
+        # --- [ View widgets are built once and reused across refreshes ] ---
+        self._tree = None
+        self._table_view = None
+        self._tables_by_title = {}
+
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(5, 5, 5, 5)
         
         # --- [ Search Bar ] ---
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("Search by class or name...")
-        self.search_bar.textChanged.connect(self.filter_views)
+        # --- [ Coalesce fast typing into a single filter pass ] ---
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(120)
+        self._filter_timer.timeout.connect(self.filter_views)
+        self.search_bar.textChanged.connect(lambda _text: self._filter_timer.start())
         self.main_layout.addWidget(self.search_bar)
         
-        self.content_widget = QWidget() # Placeholder for view content
-        self.main_layout.addWidget(self.content_widget)
+        self.content_widget = None # Active view widget, set by the show_*_view methods
 
         button_layout = QHBoxLayout()
         
@@ -86,46 +113,49 @@ class NodeorietyPanel(QWidget):
         self.show_table_view()
 
     def filter_views(self):
-        """Filters the active view based on the search bar text."""
+        """
+        Filters the active view based on the search bar text
+        Matches are found against the prebuilt text index, and only items whose visibility changes are touched
+        """
         search_text = self.search_bar.text().lower()
         
         if self.current_view == 'table':
-            for table in self.tables:
-                for i in range(table.rowCount()):
-                    item = table.item(i, 0)
-                    if item:
-                        match = search_text in item.text().lower()
-                        table.setRowHidden(i, not match)
+            for table, row_text, row_hidden in zip(self.tables, self._table_row_text, self._table_row_hidden):
+                for i, (item, text) in enumerate(row_text):
+                    hidden = search_text not in text
+                    if hidden != row_hidden[i]:
+                        row_hidden[i] = hidden
+                        # --- [ Look up the row from the item as the table may have been resorted ] ---
+                        table.setRowHidden(item.row(), hidden)
         else: # Hierarchical view
-            tree = self.content_widget
-            
             # --- [ If search is cleared, unhide everything ] ---
             if not search_text:
-                iterator = QTreeWidgetItemIterator(tree)
-                while iterator.value():
-                    iterator.value().setHidden(False)
-                    iterator += 1
-                return
-
-            # --- [ Find all items that match the search text ] ---
-            matching_items = []
-            iterator = QTreeWidgetItemIterator(tree)
-            while iterator.value():
-                item = iterator.value()
-                # Initially hide all items
-                item.setHidden(True)
-                if search_text in item.text(0).lower():
-                    matching_items.append(item)
-                iterator += 1
-
-            # --- [ Unhide matching items and their parents ] ---
-            for item in matching_items:
-                item.setHidden(False)
-                parent = item.parent()
-                while parent:
-                    parent.setHidden(False)
-                    parent.setExpanded(True)
-                    parent = parent.parent()
+                visible = None
+                parents_to_expand = []
+            else:
+                # --- [ Find all items that match the search text, and keep their parents visible ] ---
+                visible = set()
+                expanded = set()
+                parents_to_expand = []
+                for item, text, parent_chain in self._tree_index:
+                    if search_text in text:
+                        visible.add(id(item))
+                        # --- [ Each parent is queued for expanding only the first time it's reached ] ---
+                        for parent in parent_chain:
+                            if id(parent) not in expanded:
+                                expanded.add(id(parent))
+                                parents_to_expand.append(parent)
+                visible |= expanded
+
+            for i, (item, text, parent_chain) in enumerate(self._tree_index):
+                hidden = visible is not None and id(item) not in visible
+                if hidden != self._tree_hidden[i]:
+                    self._tree_hidden[i] = hidden
+                    item.setHidden(hidden)
+
+            # --- [ Expand the parents of matching items ] ---
+            for parent in parents_to_expand:
+                parent.setExpanded(True)
 
     def toggle_view(self):
         """Switch between hierarchical and table views"""
@@ -140,115 +170,193 @@ class NodeorietyPanel(QWidget):
 
     def refresh_active_view(self):
         """Refreshes whichever view is currently active"""
+        self._node_snapshot = None
         if self.current_view == 'hierarchical':
             self.show_hierarchical_view()
         else:
             self.show_table_view()
 
+    def _collect_snapshot(self):
+        """
+        Walks the script once and caches the result until the next refresh
+        Returns a flat list of (node, class, is_container) entries, and the same entries keyed by their parent container
+        Root level entries are keyed by None
+        """
+        if self._node_snapshot is None:
+            all_entries = []
+            children = defaultdict(list)
+            stack = [(None, nuke.root())]
+            while stack:
+                parent_key, parent_node = stack.pop()
+                level_entries = children[parent_key]
+                for node in parent_node.nodes():
+                    node_class = node.Class()
+                    # --- [ Check if node is a group-like container, once per class ] ---
+                    is_container = _HAS_CHILDREN_BY_CLASS.get(node_class)
+                    if is_container is None:
+                        is_container = _HAS_CHILDREN_BY_CLASS[node_class] = hasattr(node, 'nodes')
+                    entry = (node, node_class, is_container)
+                    all_entries.append(entry)
+                    level_entries.append(entry)
+                    if is_container:
+                        stack.append((node, node))
+            self._node_snapshot = (all_entries, children)
+        return self._node_snapshot
+
+    def _set_content_widget(self, widget):
+        """Shows the given view widget in the content area, hiding the previous one"""
+        if widget is self.content_widget:
+            return
+        if self.content_widget is not None:
+            self.content_widget.hide()
+        if self.main_layout.indexOf(widget) == -1:
+            self.main_layout.insertWidget(1, widget)
+        widget.show()
+        self.content_widget = widget
+
     def show_hierarchical_view(self):
-        """Rebuilds hierarchical view"""
-        self.content_widget.deleteLater()
-        self.content_widget = QTreeWidget()
-        self.content_widget.setHeaderLabels(["Nodes", "Count"])
-        header = self.content_widget.header()
-        try:
-            header.setSectionResizeMode(0, QHeaderView.Stretch)
-            header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        except AttributeError:
-            header.setResizeMode(0, QHeaderView.Stretch)
-            header.setResizeMode(1, QHeaderView.ResizeToContents)
+        """Rebuilds hierarchical view, reusing the tree widget once it exists"""
+        if self._tree is None:
+            self._tree = QTreeWidget()
+            self._tree.setHeaderLabels(["Nodes", "Count"])
+            header = self._tree.header()
+            try:
+                header.setSectionResizeMode(0, QHeaderView.Stretch)
+                header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
+            except AttributeError:
+                header.setResizeMode(0, QHeaderView.Stretch)
+                header.setResizeMode(1, QHeaderView.ResizeToContents)
+        else:
+            self._tree.clear()
 
-        self.main_layout.insertWidget(1, self.content_widget)
+        self._set_content_widget(self._tree)
 
-        root_item = QTreeWidgetItem(self.content_widget, ["Root Level", ""])
-        self._process_node_level(root_item, nuke.root())
-        root_item.setExpanded(True)
+        # --- [ Hold off repaints until the whole tree is built ] ---
+        self._tree.setUpdatesEnabled(False)
+        try:
+            root_item = QTreeWidgetItem(self._tree, ["Root Level", ""])
+            self._tree_index = [(root_item, root_item.text(0).lower(), ())]
+            self._process_node_level(root_item)
+            self._tree_hidden = [False] * len(self._tree_index)
+            root_item.setExpanded(True)
+        finally:
+            self._tree.setUpdatesEnabled(True)
         self.filter_views()
 
-    def _process_node_level(self, parent_item, parent_node):
-        """Recursive function for hierarchical view"""
-        node_counts = defaultdict(int)
-        containers_to_process = []
-        for node in parent_node.nodes():
-            node_counts[node.Class()] += 1
-            # --- [ Check if node is a group-like container ] ---
-            if hasattr(node, 'nodes'):
-                containers_to_process.append(node)
-        
-        parent_item.setText(1, str(sum(node_counts.values())))
-        for node_class, count in sorted(node_counts.items()):
-            QTreeWidgetItem(parent_item, [node_class, str(count)])
-        for container_node in sorted(containers_to_process, key=lambda n: n.name()):
-            container_item = QTreeWidgetItem(parent_item, ["{0} ({1})".format(container_node.name(), container_node.Class()), ""])
-            self._process_node_level(container_item, container_node)
+    def _process_node_level(self, root_item):
+        """
+        Fills the hierarchical view level by level from the snapshot
+        Uses a queue of (parent_item, container node, ancestor items) instead of recursing, root level is keyed by None
+        """
+        children = self._collect_snapshot()[1]
+        queue = deque([(root_item, None, (root_item,))])
+        while queue:
+            parent_item, parent_key, parent_chain = queue.popleft()
+            node_counts = defaultdict(int)
+            containers_to_process = []
+            for node, node_class, is_container in children.get(parent_key, ()):
+                node_counts[node_class] += 1
+                if is_container:
+                    containers_to_process.append((node.name(), node_class, node))
+
+            parent_item.setText(1, str(sum(node_counts.values())))
+            for node_class, count in sorted(node_counts.items()):
+                class_item = QTreeWidgetItem(parent_item, [node_class, str(count)])
+                self._tree_index.append((class_item, node_class.lower(), parent_chain))
+            for container_name, container_class, container_node in sorted(containers_to_process, key=lambda c: c[0]):
+                container_label = "{0} ({1})".format(container_name, container_class)
+                container_item = QTreeWidgetItem(parent_item, [container_label, ""])
+                self._tree_index.append((container_item, container_label.lower(), parent_chain))
+                queue.append((container_item, container_node, parent_chain + (container_item,)))
 
     def show_table_view(self):
         """Rebuilds table view"""
         
         # --- [ Get Data ] ---
-        all_nodes = nuke.allNodes(recurseGroups=True)
+        all_nodes = self._collect_snapshot()[0]
         node_counts = defaultdict(int)
         gizmo_counts = defaultdict(int)
         group_counts = defaultdict(int)
         livegroup_counts = defaultdict(int)
         precomp_counts = defaultdict(int)
 
-        for node in all_nodes:
-            node_class = node.Class()
+        container_counts = {'Group': group_counts, 'LiveGroup': livegroup_counts, 'Precomp': precomp_counts}
+
+        for node, node_class, is_container in all_nodes:
             node_counts[node_class] += 1
-            # --- [ Sanitize name to group instances like 'Blur1', 'Blur2' together ] ---
-            sanitized_match = re.match(r'^(.*?)(?:[_0-9]+)?$', node.name())
-            sanitized_name = sanitized_match.group(1) if sanitized_match else node.name()
-
-            if node_class == 'Group':
-                group_counts[sanitized_name] += 1
-            elif node_class == 'LiveGroup':
-                 livegroup_counts[sanitized_name] += 1
-            elif node_class == 'Precomp':
-                precomp_counts[sanitized_name] += 1
+
+            if node_class in _CONTAINER_CLASSES:
+                # --- [ Sanitize name to group instances like 'Blur1', 'Blur2' together ] ---
+                node_name = node.name()
+                sanitized_match = _SANITIZE_RE.match(node_name)
+                sanitized_name = sanitized_match.group(1) if sanitized_match else node_name
+                container_counts[node_class][sanitized_name] += 1
             # Note to self. Any other node that is an instance of a Group is likely a gizmo. Will need to update if new node types are introduced
             elif isinstance(node, nuke.Group):
                 gizmo_counts[node_class] += 1
         
-        # --- [ Rebuild UI ] ---
-        self.content_widget.deleteLater()
-        self.tables = []
-        self.content_widget = QWidget()
-        content_layout = QHBoxLayout(self.content_widget)
-        content_layout.setContentsMargins(0, 0, 0, 0)
-
         # --- [  Layout node counts by class/type ] ---
-        if all_nodes:
-            content_layout.addWidget(self._create_section_widget("All Nodes", len(all_nodes), node_counts, ["Node Class", "Count"]))
-        if gizmo_counts:
-            content_layout.addWidget(self._create_section_widget("Gizmos", sum(gizmo_counts.values()), gizmo_counts, ["Gizmo Class", "Count"]))
-        if group_counts:
-            content_layout.addWidget(self._create_section_widget("Groups", sum(group_counts.values()), group_counts, ["Group Name", "Count"]))
-        if precomp_counts:
-            content_layout.addWidget(self._create_section_widget("Precomps", sum(precomp_counts.values()), precomp_counts, ["Precomp Name", "Count"]))
-        if livegroup_counts:
-            content_layout.addWidget(self._create_section_widget("LiveGroups", sum(livegroup_counts.values()), livegroup_counts, ["LiveGroup Name", "Count"]))
+        sections = [
+            ("All Nodes", len(all_nodes), node_counts, ["Node Class", "Count"]),
+            ("Gizmos", sum(gizmo_counts.values()), gizmo_counts, ["Gizmo Class", "Count"]),
+            ("Groups", sum(group_counts.values()), group_counts, ["Group Name", "Count"]),
+            ("Precomps", sum(precomp_counts.values()), precomp_counts, ["Precomp Name", "Count"]),
+            ("LiveGroups", sum(livegroup_counts.values()), livegroup_counts, ["LiveGroup Name", "Count"]),
+        ]
+
+        # --- [ Build every section once, in order, then only refill them ] ---
+        if self._table_view is None:
+            self._table_view = QWidget()
+            content_layout = QHBoxLayout(self._table_view)
+            content_layout.setContentsMargins(0, 0, 0, 0)
+            for title, total, data, headers in sections:
+                section = self._create_section_widget(title, headers)
+                self._tables_by_title[title] = section
+                content_layout.addWidget(section[0])
+
+        # --- [ Only show sections that have something to count ] ---
+        self.tables = []
+        for title, total, data, headers in sections:
+            section_widget, title_label, table = self._tables_by_title[title]
+            if not data:
+                section_widget.hide()
+                continue
+            title_label.setText("<b>{0}</b> (Total: {1})".format(title, total))
+            self._populate_table(table, data)
+            self.tables.append(table)
+            section_widget.show()
         
-        self.main_layout.insertWidget(1, self.content_widget)
+        # --- [ Build the search index once per rebuild ] ---
+        self._table_row_text = []
+        for table in self.tables:
+            model = table.model()
+            items = [model.item(i, 0) for i in range(model.rowCount())]
+            self._table_row_text.append([(item, item.text().lower()) for item in items if item])
+        self._table_row_hidden = [[False] * len(row_text) for row_text in self._table_row_text]
+
+        self._set_content_widget(self._table_view)
         self.filter_views()
 
-    def _create_section_widget(self, title, total, data, headers):
-        """Helper to create a single vertical column for the table view"""
+    def _create_section_widget(self, title, headers):
+        """
+        Helper to create a single vertical column for the table view
+        Returns (section_widget, title_label, table) so the section can be refilled later
+        """
         section_widget = QWidget()
         section_layout = QVBoxLayout(section_widget)
         section_layout.setContentsMargins(5, 0, 5, 0)
-        title_label = QLabel("<b>{0}</b> (Total: {1})".format(title, total))
+        title_label = QLabel("<b>{0}</b>".format(title))
         section_layout.addWidget(title_label)
-        table = self._create_table_widget(data, headers)
-        self.tables.append(table) 
+        table = self._create_table_widget(headers)
         section_layout.addWidget(table)
-        return section_widget
+        return section_widget, title_label, table
         
-    def _create_table_widget(self, data, headers):
-        """Helper to create and populate a QTableWidget for the table view"""
-        table = QTableWidget()
-        table.setColumnCount(2)
-        table.setHorizontalHeaderLabels(headers)
+    def _create_table_widget(self, headers):
+        """Helper to create an empty QTableView, backed by a QStandardItemModel, for the table view"""
+        table = QTableView()
+        model = QStandardItemModel(0, 2, table)
+        model.setHorizontalHeaderLabels(headers)
+        table.setModel(model)
         table.setSortingEnabled(True)
         table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         header = table.horizontalHeader()
@@ -259,17 +367,34 @@ class NodeorietyPanel(QWidget):
         except AttributeError:
             header.setResizeMode(0, QHeaderView.Stretch)
             header.setResizeMode(1, QHeaderView.ResizeToContents)
+        return table
 
-        
+    def _populate_table(self, table, data):
+        """Refills a table in place with (name, count) rows"""
         sorted_data = sorted(data.items(), key=lambda item: item[1], reverse=True)
-        table.setRowCount(len(sorted_data))
-        for row, (name, count) in enumerate(sorted_data):
-            name_item = QTableWidgetItem(name)
-            count_item = QTableWidgetItem()
-            count_item.setData(Qt.EditRole, count)
-            table.setItem(row, 0, name_item)
-            table.setItem(row, 1, count_item)
-        return table
+        # --- [ Qt resorts after every setItem while sorting is on, so fill first and sort once ] ---
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        # --- [ One model reset for the whole refill, the view skips the per-row and per-item signals ] ---
+        model = table.model()
+        model.beginResetModel()
+        model.blockSignals(True)
+        set_item = model.setItem
+        try:
+            # --- [ Dropping the old rows also drops any rows hidden by the last search ] ---
+            model.setRowCount(0)
+            model.setRowCount(len(sorted_data))
+            for row, (name, count) in enumerate(sorted_data):
+                count_item = QStandardItem()
+                count_item.setData(count, Qt.EditRole)
+                set_item(row, 0, QStandardItem(name))
+                set_item(row, 1, count_item)
+        finally:
+            model.blockSignals(False)
+            model.endResetModel()
+            table.setUpdatesEnabled(True)
+        table.setSortingEnabled(True)
+        table.viewport().update()
 
 # --- [  Global variable to get around Pythons garbage collector ] ---
 _nodeoriety_floating_panel = None
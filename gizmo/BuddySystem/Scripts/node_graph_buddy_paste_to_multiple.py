@@ -33,29 +33,27 @@ def multipaste_and_select():
         nuke.message("Please select at least one node to paste to")
         return
 
-    # --- [ Get all nodes that exist before paste ] ---
-    nodes_before = set(nuke.allNodes())
+    with nuke.Undo("Paste To Multiple"):
+        # --- [ Record the names of all nodes that exist before paste ] ---
+        names_before = set(n.name() for n in nuke.allNodes())
 
-    # --- [ Paste Logic ] ---
-    for target_node in initial_selection:
-        for n in nuke.selectedNodes():
-            n.setSelected(False)
-            
-        target_node.setSelected(True)
-        
-        nuke.nodePaste('%clipboard%')
+        # --- [ Paste Logic ] ---
+        # --- [ Only the nodes we selected, or the last paste selected, need clearing ] ---
+        prev_selected = initial_selection
+        for target_node in initial_selection:
+            for n in prev_selected:
+                n.setSelected(False)
+
+            target_node.setSelected(True)
 
-    # --- [ Get all nodes that exist after paste ] ---
-    nodes_after = set(nuke.allNodes())
+            nuke.nodePaste('%clipboard%')
+            prev_selected = nuke.selectedNodes()
 
-    # --- [ Find the difference and select only new nodes] ---
-    newly_pasted_nodes = nodes_after - nodes_before
+        # --- [ Any node whose name wasn't there before is new, select only those ] ---
+        newly_pasted_nodes = [n for n in nuke.allNodes() if n.name() not in names_before]
+
+        for n in prev_selected:
+            n.setSelected(False)
 
-    for n in nuke.selectedNodes():
-        n.setSelected(False)
-        
-    if newly_pasted_nodes:
         for node in newly_pasted_nodes:
             node.setSelected(True)
-    else:
-        pass
\ No newline at end of file
@@ -24,6 +24,12 @@
 
 import nuke
 
+# --- [ numpy is optional, only used to speed up large selections ] ---
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # --- [  Import PySide based on nuke version ] --- 
 if nuke.NUKE_VERSION_MAJOR < 11:
     from PySide import QtCore, QtGui
@@ -44,6 +50,9 @@ _og_cache = {}
 _h_center = 'left'
 _v_center = 'top'
 
+# --- [ Selections larger than this use numpy, when available ] ---
+_NUMPY_MIN_ITEMS = 32
+
 # --- [ directional flags, for biased and center modes ] ---
 _AXIS_FLAGS = {
     'bdwidth':         (True,  False),
@@ -59,6 +68,49 @@ _AXIS_FLAGS = {
 #                       ---- Scripts ----
 #===============================================================================
 
+def _iround(x):
+    """Rounds half away from zero straight to an int, avoiding the round() then int() pair"""
+    return int(x + 0.5) if x >= 0 else int(x - 0.5)
+
+
+def _np_scaled_positions(arr, px_abs, py_abs, scale_w, scale_h, centered):
+    """
+    Scales rows of (x, y, w, h) about the pivot in one vectorized pass
+    centered: rows hold node centers, so half the size is taken off to get the top left corner
+    Returns a list of [x, y] ints rounded half away from zero, matching _iround
+    """
+    xs = px_abs + (arr[:, 0] - px_abs) * scale_w
+    ys = py_abs + (arr[:, 1] - py_abs) * scale_h
+    if centered:
+        xs -= arr[:, 2] / 2.0
+        ys -= arr[:, 3] / 2.0
+    pos = np.stack((xs, ys), axis=1)
+    return np.trunc(pos + np.copysign(0.5, pos)).astype(np.int64).tolist()
+
+
+def _compute_bbox(orig_bd, orig_ctr, bd_arr=None, ctr_arr=None):
+    """
+    Returns (x, y, w, h) bounding the backdrops and node centers
+    bd_arr/ctr_arr: the cached (x, y, w, h) arrays, when set the bbox is a column-wise min/max over them
+    """
+    if ctr_arr is not None:
+        top_left = np.concatenate((bd_arr[:, :2], ctr_arr[:, :2]))
+        bottom_right = np.concatenate((bd_arr[:, :2] + bd_arr[:, 2:], ctr_arr[:, :2]))
+        box_x0, box_y0 = top_left.min(0).tolist()
+        box_x1, box_y1 = bottom_right.max(0).tolist()
+        return box_x0, box_y0, box_x1 - box_x0, box_y1 - box_y0
+
+    xs, ys, xws, yhs = [], [], [], []
+    for x, y, w, h in orig_bd.values():
+        xs.append(x); ys.append(y)
+        xws.append(x + w); yhs.append(y + h)
+    for cx, cy, _w, _h in orig_ctr.values():
+        xs.append(cx); ys.append(cy)
+        xws.append(cx); yhs.append(cy)
+    box_x0, box_y0 = min(xs), min(ys)
+    return box_x0, box_y0, max(xws) - box_x0, max(yhs) - box_y0
+
+
 def scale_node_dimensions(mode='increase', direction='bdwidth'):
     """
     mode:      'increase' or 'decrease'
@@ -82,6 +134,9 @@ def scale_node_dimensions(mode='increase', direction='bdwidth'):
     # --- [ Makes scale delta relative to zoom level ] ---
     zoom = nuke.zoom()
     delta = int(10.0 / zoom) * (-1 if mode == 'decrease' else 1)
+    # --- [ Zoomed in far enough that there's nothing to scale ] ---
+    if delta == 0:
+        return
 
     axis_w, axis_h = _AXIS_FLAGS[direction]
 
@@ -110,7 +165,8 @@ def scale_node_dimensions(mode='increase', direction='bdwidth'):
         py = 0.0 if _v_center == 'top' else 1.0
 
     # --- [ Cache Update ] ---
-    key = (tuple(sel), mode, direction, _h_center, _v_center)
+    # --- [ Scalars first so a mode/direction change mismatches before any nodes are compared ] ---
+    key = (mode, direction, _h_center, _v_center, len(sel), tuple(sel))
     if _og_cache.get('key') != key:
         _og_cache.clear()
         _og_cache['key'] = key
@@ -118,28 +174,30 @@ def scale_node_dimensions(mode='increase', direction='bdwidth'):
             bd: (bd.xpos(), bd.ypos(), bd['bdwidth'].value(), bd['bdheight'].value())
             for bd in bd_sel
         }
-        _og_cache['orig_ctr'] = {
-            n: (n.xpos() + n.screenWidth() / 2.0,
-                n.ypos() + n.screenHeight() / 2.0)
-            for n in node_sel
-        }
+        # --- [ Node sizes don't change while scaling so keep them with the centers ] ---
+        orig_ctr = {}
+        for n in node_sel:
+            w, h = n.screenWidth(), n.screenHeight()
+            orig_ctr[n] = (n.xpos() + w / 2.0, n.ypos() + h / 2.0, w, h)
+        _og_cache['orig_ctr'] = orig_ctr
+        # --- [ Flattened once per selection for the per-keypress loops ] ---
+        _og_cache['bd_items'] = list(_og_cache['orig_bd'].items())
+        _og_cache['ctr_items'] = list(orig_ctr.items())
+        # --- [ Large selections also keep the values as arrays for the vectorized path ] ---
+        if np is not None and len(bd_sel) + len(node_sel) > _NUMPY_MIN_ITEMS:
+            _og_cache['bd_arr'] = np.array([v for _, v in _og_cache['bd_items']], dtype=np.float64).reshape(-1, 4)
+            _og_cache['ctr_arr'] = np.array([v for _, v in _og_cache['ctr_items']], dtype=np.float64).reshape(-1, 4)
+        else:
+            _og_cache['bd_arr'] = _og_cache['ctr_arr'] = None
         # --- [ Compute BBox ] ---
-        xs, ys, xws, yhs = [], [], [], []
-        for x, y, w, h in _og_cache['orig_bd'].values():
-            xs.append(x); ys.append(y)
-            xws.append(x + w); yhs.append(y + h)
-        for cx, cy in _og_cache['orig_ctr'].values():
-            xs.append(cx); ys.append(cy)
-            xws.append(cx); yhs.append(cy)
-        box_x0, box_y0 = min(xs), min(ys)
-        orig_w = max(xws) - box_x0
-        orig_h = max(yhs) - box_y0
+        box_x0, box_y0, orig_w, orig_h = _compute_bbox(_og_cache['orig_bd'], _og_cache['orig_ctr'],
+                                                       _og_cache['bd_arr'], _og_cache['ctr_arr'])
         _og_cache['orig_bbox'] = (box_x0, box_y0, orig_w, orig_h)
         _og_cache['curr_w'], _og_cache['curr_h'] = orig_w, orig_h
 
     # --- [ Retrieve Cache ] ---
-    orig_bd = _og_cache['orig_bd']
-    orig_ctr = _og_cache['orig_ctr']
+    bd_items = _og_cache['bd_items']
+    ctr_items = _og_cache['ctr_items']
     box_x0, box_y0, orig_w, orig_h = _og_cache['orig_bbox']
     curr_w, curr_h = _og_cache['curr_w'], _og_cache['curr_h']
 
@@ -155,22 +213,29 @@ def scale_node_dimensions(mode='increase', direction='bdwidth'):
     px_abs = box_x0 + px * orig_w
     py_abs = box_y0 + py * orig_h
 
+    # --- [ Compute new positions, the Nuke calls below are all that's left per node ] ---
+    bd_arr, ctr_arr = _og_cache['bd_arr'], _og_cache['ctr_arr']
+    if ctr_arr is not None:
+        bd_pos = _np_scaled_positions(bd_arr, px_abs, py_abs, scale_w, scale_h, centered=False)
+        ctr_pos = _np_scaled_positions(ctr_arr, px_abs, py_abs, scale_w, scale_h, centered=True)
+    else:
+        iround = _iround
+        bd_pos = [(iround(px_abs + (ox - px_abs) * scale_w), iround(py_abs + (oy - py_abs) * scale_h))
+                  for _bd, (ox, oy, _ow, _oh) in bd_items]
+        ctr_pos = [(iround(px_abs + (cx - px_abs) * scale_w - w / 2.0), iround(py_abs + (cy - py_abs) * scale_h - h / 2.0))
+                   for _n, (cx, cy, w, h) in ctr_items]
+
     # --- [ Scale Backdrops ] ---
-    for bd, (ox, oy, ow, oh) in orig_bd.items():
+    for (bd, (ox, oy, ow, oh)), (nx, ny) in zip(bd_items, bd_pos):
         if axis_w: bd['bdwidth'].setValue(ow * scale_w)
         if axis_h: bd['bdheight'].setValue(oh * scale_h)
-        nx = px_abs + (ox - px_abs) * scale_w
-        ny = py_abs + (oy - py_abs) * scale_h
-        bd.setXpos(int(round(nx)))
-        bd.setYpos(int(round(ny)))
+        bd.setXpos(nx)
+        bd.setYpos(ny)
 
     # --- [ Scale Nodes ] ---
-    for n, (cx, cy) in orig_ctr.items():
-        ncx = px_abs + (cx - px_abs) * scale_w
-        ncy = py_abs + (cy - py_abs) * scale_h
-        w, h = n.screenWidth(), n.screenHeight()
-        n.setXpos(int(round(ncx - w / 2.0)))
-        n.setYpos(int(round(ncy - h / 2.0)))
+    for (n, _), (nx, ny) in zip(ctr_items, ctr_pos):
+        n.setXpos(nx)
+        n.setYpos(ny)
 
     _og_cache['curr_w'], _og_cache['curr_h'] = new_w, new_h
 
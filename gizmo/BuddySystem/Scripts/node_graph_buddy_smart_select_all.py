@@ -24,6 +24,7 @@
 #===============================================================================
 
 import nuke
+from operator import itemgetter
 
 #===============================================================================
 #                       ---- Scripts ----
@@ -35,14 +36,48 @@ def _get_node_bounds(node):
     y1 = node.ypos()
     
     if node.Class() == 'BackdropNode':
-        x2 = x1 + node.knob('bdwidth').value()
-        y2 = y1 + node.knob('bdheight').value()
+        k = node.knobs()
+        x2 = x1 + k['bdwidth'].value()
+        y2 = y1 + k['bdheight'].value()
     else:
         x2 = x1 + node.screenWidth()
         y2 = y1 + node.screenHeight()
         
     return x1, y1, x2, y2
 
+def _get_cursor_position():
+    """
+    Returns the node graph position under the mouse cursor
+    Nuke has no direct query for this, so a temporary Dot is created at the cursor and removed again
+    Undo is disabled around it so the Dot never reaches the undo history
+    """
+    nuke.Undo.disable()
+    try:
+        temp_dot = nuke.createNode('Dot', inpanel=False)
+        dot_x = temp_dot.xpos() + temp_dot.screenWidth() / 2
+        dot_y = temp_dot.ypos() + temp_dot.screenHeight() / 2
+        nuke.delete(temp_dot)
+    finally:
+        nuke.Undo.enable()
+    return dot_x, dot_y
+
+def _rect_inside(bounds, x1, y1, x2, y2):
+    """Returns True if bounds, as (x1, y1, x2, y2), lies fully inside the given rectangle"""
+    return bounds[0] >= x1 and bounds[2] <= x2 and bounds[1] >= y1 and bounds[3] <= y2
+
+def _backdrops_containing(bd_bounds, x1, y1, x2, y2, exclude=()):
+    """
+    Returns the entries from bd_bounds, a list of (bd, x1, y1, x2, y2, area), whose backdrop fully contains the given rectangle
+    Backdrops in exclude are skipped
+    """
+    return [entry for entry in bd_bounds
+            if x1 >= entry[1] and x2 <= entry[3] and y1 >= entry[2] and y2 <= entry[4] and entry[0] not in exclude]
+
+def _clear_selection():
+    """Deselects every selected node, touching only the selection rather than every node in the script"""
+    for node in nuke.selectedNodes():
+        node.setSelected(False)
+
 def _select_backdrop_and_contents(backdrop, select_contents=True, current_selection=None):
     """
     Selects the backdrop and handles contents based on arguments
@@ -56,8 +91,7 @@ def _select_backdrop_and_contents(backdrop, select_contents=True, current_select
     if not backdrop:
         return
         
-    for node in nuke.allNodes():
-        node['selected'].setValue(False)
+    _clear_selection()
         
     backdrop['selected'].setValue(True)
     
@@ -86,38 +120,33 @@ def smart_select_all(select_contents=True):
     all_backdrops = nuke.allNodes('BackdropNode')
     candidate_backdrops = []
 
+    # --- [ Read every backdrop's bounds and area once, as (bd, x1, y1, x2, y2, area) ] ---
+    bd_bounds = []
+    for bd in all_backdrops:
+        x1, y1, x2, y2 = _get_node_bounds(bd)
+        bd_bounds.append((bd, x1, y1, x2, y2, (x2 - x1) * (y2 - y1)))
+
     if not selection:
         # --- [ Condition #1: Nothing is selected ] ---
-        temp_dot = nuke.createNode('Dot', inpanel=False)
-        dot_x = temp_dot.xpos() + temp_dot.screenWidth() / 2
-        dot_y = temp_dot.ypos() + temp_dot.screenHeight() / 2
-        nuke.delete(temp_dot)
+        dot_x, dot_y = _get_cursor_position()
 
-        for bd in all_backdrops:
-            bd_x1, bd_y1, bd_x2, bd_y2 = _get_node_bounds(bd)
-            if bd_x1 < dot_x < bd_x2 and bd_y1 < dot_y < bd_y2:
-                candidate_backdrops.append(bd)
+        for entry in bd_bounds:
+            if entry[1] < dot_x < entry[3] and entry[2] < dot_y < entry[4]:
+                candidate_backdrops.append(entry)
     else:
         # --- [ Conditions #2 + #3: Nodes are selected ] ---
-        for bd in all_backdrops:
-            if bd in selection:
-                continue
-
-            bd_x1, bd_y1, bd_x2, bd_y2 = _get_node_bounds(bd)
-            is_fully_contained = True
-            for node in selection:
-                node_x1, node_y1, node_x2, node_y2 = _get_node_bounds(node)
-                if not (node_x1 >= bd_x1 and node_x2 <= bd_x2 and node_y1 >= bd_y1 and node_y2 <= bd_y2):
-                    is_fully_contained = False
-                    break
-            
-            if is_fully_contained:
-                candidate_backdrops.append(bd)
+        # --- [ A backdrop holds every selected node exactly when it holds their combined bbox ] ---
+        sel_bounds = [_get_node_bounds(node) for node in selection]
+        sel_x1 = min(b[0] for b in sel_bounds)
+        sel_y1 = min(b[1] for b in sel_bounds)
+        sel_x2 = max(b[2] for b in sel_bounds)
+        sel_y2 = max(b[3] for b in sel_bounds)
+        candidate_backdrops = _backdrops_containing(bd_bounds, sel_x1, sel_y1, sel_x2, sel_y2, set(selection))
 
     # --- [ Final Selection Logic ] ---
     if candidate_backdrops:
-        candidate_backdrops.sort(key=lambda bd: bd.knob('bdwidth').value() * bd.knob('bdheight').value())
-        smallest_backdrop = candidate_backdrops[0]
+        candidate_backdrops.sort(key=itemgetter(5))
+        smallest_backdrop = candidate_backdrops[0][0]
         _select_backdrop_and_contents(smallest_backdrop, select_contents, selection)
     else:
         if not select_contents and selection:
@@ -125,23 +154,27 @@ def smart_select_all(select_contents=True):
             selected_parent_backdrops = [node for node in selection if node.Class() == 'BackdropNode']
             
             if selected_parent_backdrops:
-                all_child_candidates = [bd for bd in nuke.allNodes('BackdropNode') if bd not in selected_parent_backdrops]
-
-                for parent_bd in selected_parent_backdrops:
-                    parent_x1, parent_y1, parent_x2, parent_y2 = _get_node_bounds(parent_bd)
-                    for child_bd in all_child_candidates:
-                        if child_bd in contained_backdrops:
-                            continue
-
-                        child_x1, child_y1, child_x2, child_y2 = _get_node_bounds(child_bd)
-                        
-                        if (child_x1 >= parent_x1 and child_x2 <= parent_x2 and
-                            child_y1 >= parent_y1 and child_y2 <= parent_y2):
-                            contained_backdrops.append(child_bd)
+                sel_set = set(selected_parent_backdrops)
+                all_child_candidates = [bd for bd in all_backdrops if bd not in sel_set]
+                bounds_by_bd = dict((entry[0], entry[1:5]) for entry in bd_bounds)
+
+                # --- [ A child outside the selected backdrops' combined bbox can't sit in any of them ] ---
+                parent_bounds = [bounds_by_bd[bd] for bd in selected_parent_backdrops]
+                union_x1 = min(b[0] for b in parent_bounds)
+                union_y1 = min(b[1] for b in parent_bounds)
+                union_x2 = max(b[2] for b in parent_bounds)
+                union_y2 = max(b[3] for b in parent_bounds)
+                all_child_candidates = [bd for bd in all_child_candidates
+                                        if _rect_inside(bounds_by_bd[bd], union_x1, union_y1, union_x2, union_y2)]
+
+                # --- [ Each child is tested once, stopping at the first selected backdrop that holds it ] ---
+                for child_bd in all_child_candidates:
+                    child_bounds = bounds_by_bd[child_bd]
+                    if any(_rect_inside(child_bounds, *bounds) for bounds in parent_bounds):
+                        contained_backdrops.append(child_bd)
                 
                 if contained_backdrops:
-                    for n in nuke.allNodes():
-                        n['selected'].setValue(False)
+                    _clear_selection()
                     
                     for n in selected_parent_backdrops + contained_backdrops:
                         n['selected'].setValue(True)
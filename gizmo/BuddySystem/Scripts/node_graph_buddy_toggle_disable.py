@@ -33,8 +33,9 @@ def toggle_disable():
     if not selected_nodes:
         return
     else:
-        for node in selected_nodes:
-          if 'disable' in node.knobs():
-            is_disabled = node['disable'].value()          
-            # --- [ Set knob to its opposite value ] ---
-            node['disable'].setValue(not is_disabled)
\ No newline at end of file
+        with nuke.Undo("Toggle Disable"):
+            for node in selected_nodes:
+              disable_knob = node.knob('disable')
+              if disable_knob is not None:
+                # --- [ Set knob to its opposite value ] ---
+                disable_knob.setValue(not disable_knob.value())
\ No newline at end of file
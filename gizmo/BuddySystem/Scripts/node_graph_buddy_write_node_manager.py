@@ -25,6 +25,7 @@ import nuke
 import re
 import time
 import nukescripts
+from contextlib import contextmanager
 
 # --- [  Import PySide based on nuke version ] --- 
 if nuke.NUKE_VERSION_MAJOR < 11:
@@ -39,20 +40,86 @@ else:
 #                       ---- Scripts ----
 #===============================================================================
 
+def _snapshot_write_node(node):
+    """Reads the knobs the table shows, None if the node can't be read"""
+    try:
+        # --- [ One knobs() call instead of a knob lookup per field ] ---
+        k = node.knobs()
+        return {
+            'name': node.name(),
+            'label': k['label'].value(),
+            'file': k['file'].value(),
+            'render_order': int(k['render_order'].value()),
+            'channels': k['channels'].value(),
+            'colorspace': k['colorspace'].value(),
+            'file_type': k['file_type'].value(),
+            'is_disabled': k['disable'].value(),
+            'first': int(k['first'].value()),
+            'last': int(k['last'].value()),
+            'use_limit': k['use_limit'].value()
+        }
+    except Exception as e:
+        print("Write Order Panel: Error processing node '{}', skipping it.".format(node.name()))
+        return None
+
+def _get_write_node_data():
+    """Reads every Write node in the script, so the table always shows live values"""
+    node_data_list = []
+    for node in nuke.allNodes('Write'):
+        node_dict = _snapshot_write_node(node)
+        if node_dict is not None:
+            node_data_list.append(node_dict)
+    return node_data_list
+
+# --- [ Row styling, built once instead of per row ] ---
+_DISABLED_BG_COLOR = QtGui.QColor(30, 30, 30)
+_MUTED_TEXT_COLOR = QtGui.QColor(128, 128, 128)
+_DEFAULT_BRUSH = QtGui.QBrush()
+_CHECKBOX_FLAGS = QtCore.Qt.ItemIsUserCheckable | QtCore.Qt.ItemIsEnabled
+_EDITABLE_FLAGS = (QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsUserCheckable | QtCore.Qt.ItemIsEnabled |
+                   QtCore.Qt.ItemIsDragEnabled | QtCore.Qt.ItemIsDropEnabled | QtCore.Qt.ItemIsEditable)
+_UNEDITABLE_FLAGS = _EDITABLE_FLAGS & ~QtCore.Qt.ItemIsEditable
+
+@contextmanager
+def _signals_blocked(widget):
+    """Blocks a widget's signals for the block, restoring the previous state even if it raises"""
+    was_blocked = widget.blockSignals(True)
+    try:
+        yield
+    finally:
+        widget.blockSignals(was_blocked)
+
+# --- [ Valid Nuke node name, compiled once ] ---
+_VALID_NAME_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+# --- [ Role holding the numeric sort key, so sorting never re-parses cell text ] ---
+_SORT_ROLE = QtCore.Qt.UserRole + 1
+
 class NumericTableWidgetItem(QtWidgets.QTableWidgetItem):
     """For proper numeric sorting"""
+    def __init__(self, value):
+        super(NumericTableWidgetItem, self).__init__(str(value))
+        self.setData(_SORT_ROLE, value)
+
     def __lt__(self, other):
-        try:
-            return float(self.text()) < float(other.text())
-        except (ValueError, TypeError):
-            return super(NumericTableWidgetItem, self).__lt__(other)
+        a = self.data(_SORT_ROLE)
+        b = other.data(_SORT_ROLE)
+        if a is not None and b is not None:
+            return a < b
+        return super(NumericTableWidgetItem, self).__lt__(other)
 
 class WriteOrderPanel(QtWidgets.QWidget):
     """The main Panel UI for Write Node Manager"""
     def __init__(self):
         """Panel Layout"""
         super(WriteOrderPanel, self).__init__()
-        self._is_updating = False
+
+        # --- [ Normal and struck-out fonts, indexed by is_disabled ] ---
+        font_normal = QtGui.QFont()
+        font_strike = QtGui.QFont(font_normal)
+        font_strike.setStrikeOut(True)
+        self._row_fonts = (font_normal, font_strike)
+        self._sized_row_count = None
 
         self.main_layout = QtWidgets.QVBoxLayout()
         info_label = QtWidgets.QLabel("Double click a field to edit. Double click Node Name to zoom/edit")
@@ -88,115 +155,110 @@ class WriteOrderPanel(QtWidgets.QWidget):
 
     def populate_table(self):
         """Refreshes the table to keep data up to date"""
-        self.write_nodes_table.blockSignals(True)
-        self.write_nodes_table.setSortingEnabled(False)
-        
-        header = self.write_nodes_table.horizontalHeader()
-        sort_column = header.sortIndicatorSection()
-        sort_order = header.sortIndicatorOrder()
+        with _signals_blocked(self.write_nodes_table):
+            self._populate_rows()
 
-        all_write_nodes = nuke.allNodes('Write')
-        node_data_list = []
+    def _populate_rows(self):
+        """Fills the table, called with the table's signals blocked"""
+        self.write_nodes_table.setSortingEnabled(False)
+        # --- [ No per-cell repaints while the rows are filled ] ---
+        self.write_nodes_table.setUpdatesEnabled(False)
+        self.write_nodes_table.viewport().setUpdatesEnabled(False)
 
-        for node in all_write_nodes:
-            try:
-                node_data_list.append({
-                    'name': node.name(),
-                    'label': node['label'].value(),
-                    'file': node['file'].value(),
-                    'render_order': int(node['render_order'].value()),
-                    'channels': node['channels'].value(),
-                    'colorspace': node['colorspace'].value(),
-                    'file_type': node['file_type'].value(),
-                    'is_disabled': node['disable'].value(),
-                    'first': int(node['first'].value()),
-                    'last': int(node['last'].value()),
-                    'use_limit': node['use_limit'].value()
-                })
-            except Exception as e:
-                print("Write Order Panel: Error processing node '{}', skipping it.".format(node.name()))
+        node_data_list = _get_write_node_data()
 
         self.write_nodes_table.setRowCount(0)
         self.write_nodes_table.setRowCount(len(node_data_list))
 
-        # --- [ Define conditional row colors ] ---
-        disabled_bg_color = QtGui.QColor(30, 30, 30) 
-        muted_text_color = QtGui.QColor(128, 128, 128)
-
+        set_item = self.write_nodes_table.setItem
         for row_index, node_dict in enumerate(node_data_list):
             disable_check_item = QtWidgets.QTableWidgetItem()
-            disable_check_item.setFlags(QtCore.Qt.ItemIsUserCheckable | QtCore.Qt.ItemIsEnabled)
+            disable_check_item.setFlags(_CHECKBOX_FLAGS)
             disable_check_item.setCheckState(QtCore.Qt.Checked if node_dict['is_disabled'] else QtCore.Qt.Unchecked)
             
-            item_order = NumericTableWidgetItem(str(node_dict['render_order']))
+            item_order = NumericTableWidgetItem(node_dict['render_order'])
             item_name = QtWidgets.QTableWidgetItem(node_dict['name'])
             item_label = QtWidgets.QTableWidgetItem(node_dict['label'])
             item_file = QtWidgets.QTableWidgetItem(node_dict['file'])
             item_channels = QtWidgets.QTableWidgetItem(node_dict['channels'])
             item_colorspace = QtWidgets.QTableWidgetItem(node_dict['colorspace'])
             item_file_type = QtWidgets.QTableWidgetItem(node_dict['file_type'])
-            item_first = NumericTableWidgetItem(str(node_dict['first']))
-            item_last = NumericTableWidgetItem(str(node_dict['last']))
+            item_first = NumericTableWidgetItem(node_dict['first'])
+            item_last = NumericTableWidgetItem(node_dict['last'])
             
             use_limit_check_item = QtWidgets.QTableWidgetItem()
-            use_limit_check_item.setFlags(QtCore.Qt.ItemIsUserCheckable | QtCore.Qt.ItemIsEnabled)
+            use_limit_check_item.setFlags(_CHECKBOX_FLAGS)
             use_limit_check_item.setCheckState(QtCore.Qt.Checked if node_dict['use_limit'] else QtCore.Qt.Unchecked)
 
             item_name.setData(QtCore.Qt.UserRole, node_dict['name'])
             
-            # --- [ Styling ] ---
-            font = item_name.font()
-            is_disabled = node_dict['is_disabled']
-            font.setStrikeOut(is_disabled)
-            
             all_items_in_row = [disable_check_item, item_order, item_name, item_label, item_file, item_channels, item_colorspace, item_file_type, item_first, item_last, use_limit_check_item]
+            self._style_row_items(all_items_in_row, node_dict['is_disabled'], node_dict['use_limit'])
             
-            for item in all_items_in_row:
-                item.setFont(font)
-                if is_disabled:
-                    item.setBackground(disabled_bg_color)
-            
-            item_channels.setForeground(muted_text_color)
-            item_colorspace.setForeground(muted_text_color)
-            item_file_type.setForeground(muted_text_color)
-            
-            # --- [ Conditional Knobs ] ---
-            uneditable_flags = item_channels.flags() & ~QtCore.Qt.ItemIsEditable
-            item_channels.setFlags(uneditable_flags)
-            item_colorspace.setFlags(uneditable_flags)
-            item_file_type.setFlags(uneditable_flags)
-            
-            if not node_dict['use_limit']:
-                item_first.setFlags(uneditable_flags)
-                item_last.setFlags(uneditable_flags)
-                item_first.setForeground(muted_text_color)
-                item_last.setForeground(muted_text_color)
+            # --- [ Place items in table, list order matches the column order ] ---
+            for column, item in enumerate(all_items_in_row):
+                set_item(row_index, column, item)
+
+        self.write_nodes_table.viewport().setUpdatesEnabled(True)
+        self.write_nodes_table.setUpdatesEnabled(True)
+
+        # --- [ Column widths, only measured on first fill or when the row count changes ] ---
+        if len(node_data_list) != self._sized_row_count:
+            self._sized_row_count = len(node_data_list)
+            for column in (0, 5, 6, 7, 8, 9, 10):
+                self.write_nodes_table.resizeColumnToContents(column)
             
-            # --- [ Place items in table ] ---
-            self.write_nodes_table.setItem(row_index, 0, disable_check_item)
-            self.write_nodes_table.setItem(row_index, 1, item_order)
-            self.write_nodes_table.setItem(row_index, 2, item_name)
-            self.write_nodes_table.setItem(row_index, 3, item_label)
-            self.write_nodes_table.setItem(row_index, 4, item_file)
-            self.write_nodes_table.setItem(row_index, 5, item_channels)
-            self.write_nodes_table.setItem(row_index, 6, item_colorspace)
-            self.write_nodes_table.setItem(row_index, 7, item_file_type)
-            self.write_nodes_table.setItem(row_index, 8, item_first)
-            self.write_nodes_table.setItem(row_index, 9, item_last)
-            self.write_nodes_table.setItem(row_index, 10, use_limit_check_item)
-
-        self.write_nodes_table.resizeColumnsToContents()
-        
-        # --- [ Column widths ] ---
-        self.write_nodes_table.setColumnWidth(1, 75) # Order
-        self.write_nodes_table.setColumnWidth(2, 100) # Node Name
-        self.write_nodes_table.setColumnWidth(3, 100) # Label
-        self.write_nodes_table.setColumnWidth(4, 500) # File
+            self.write_nodes_table.setColumnWidth(1, 75) # Order
+            self.write_nodes_table.setColumnWidth(2, 100) # Node Name
+            self.write_nodes_table.setColumnWidth(3, 100) # Label
+            self.write_nodes_table.setColumnWidth(4, 500) # File
 
+        # --- [ Re-enabling sorting re-sorts by the header's current indicator ] ---
         self.write_nodes_table.setSortingEnabled(True)
-        self.write_nodes_table.sortItems(sort_column, sort_order)
+
+    def _style_row_items(self, all_items_in_row, is_disabled, use_limit):
+        """
+        Applies the disabled and limit-to-range styling to the 11 items of one row
+        Resets anything a previous style may have set, so it can restyle a row in place
+        """
+        (disable_check_item, item_order, item_name, item_label, item_file, item_channels,
+         item_colorspace, item_file_type, item_first, item_last, use_limit_check_item) = all_items_in_row
+
+        # --- [ Styling ] ---
+        font = self._row_fonts[bool(is_disabled)]
+        background = _DISABLED_BG_COLOR if is_disabled else _DEFAULT_BRUSH
+        
+        for item in all_items_in_row:
+            item.setFont(font)
+            item.setBackground(background)
         
-        self.write_nodes_table.blockSignals(False)
+        item_channels.setForeground(_MUTED_TEXT_COLOR)
+        item_colorspace.setForeground(_MUTED_TEXT_COLOR)
+        item_file_type.setForeground(_MUTED_TEXT_COLOR)
+        
+        # --- [ Conditional Knobs ] ---
+        item_channels.setFlags(_UNEDITABLE_FLAGS)
+        item_colorspace.setFlags(_UNEDITABLE_FLAGS)
+        item_file_type.setFlags(_UNEDITABLE_FLAGS)
+        
+        if use_limit:
+            item_first.setFlags(_EDITABLE_FLAGS)
+            item_last.setFlags(_EDITABLE_FLAGS)
+            item_first.setForeground(_DEFAULT_BRUSH)
+            item_last.setForeground(_DEFAULT_BRUSH)
+        else:
+            item_first.setFlags(_UNEDITABLE_FLAGS)
+            item_last.setFlags(_UNEDITABLE_FLAGS)
+            item_first.setForeground(_MUTED_TEXT_COLOR)
+            item_last.setForeground(_MUTED_TEXT_COLOR)
+
+    def _apply_row_style(self, row, is_disabled, use_limit):
+        """Restyles a single row in place, instead of rebuilding the whole table"""
+        all_items_in_row = [self.write_nodes_table.item(row, column) for column in range(11)]
+        if None in all_items_in_row:
+            return
+        with _signals_blocked(self.write_nodes_table):
+            self._style_row_items(all_items_in_row, is_disabled, use_limit)
 
     def on_item_double_clicked(self, item):
         """Double click logic"""
@@ -205,37 +267,27 @@ class WriteOrderPanel(QtWidgets.QWidget):
 
     def on_item_changed(self, item):
         """Knob changed"""
-        if self._is_updating: return
-
         column = item.column()
         # --- [ 'disable' checkbox (column 0) ] ---
         if column == 0:
-            self._is_updating = True
-            row = item.row()
-            name_item = self.write_nodes_table.item(row, 2)
-            if name_item:
-                node = nuke.toNode(name_item.data(QtCore.Qt.UserRole))
-                if node:
-                    node['disable'].setValue(item.checkState() == QtCore.Qt.Checked)
-                    self.populate_table()
-            self._is_updating = False
-        
+            knob_name = 'disable'
         # --- [ 'use_limit' checkbox (column 10)  ] ---
         elif column == 10:
-            self._is_updating = True
+            knob_name = 'use_limit'
+        else:
+            return
+
+        with _signals_blocked(self.write_nodes_table):
             row = item.row()
             name_item = self.write_nodes_table.item(row, 2)
             if name_item:
                 node = nuke.toNode(name_item.data(QtCore.Qt.UserRole))
                 if node:
-                    node['use_limit'].setValue(item.checkState() == QtCore.Qt.Checked)
-                    self.populate_table()
-            self._is_updating = False
+                    node[knob_name].setValue(item.checkState() == QtCore.Qt.Checked)
+                    self._apply_row_style(row, node['disable'].value(), node['use_limit'].value())
             
     def on_cell_changed(self, row, column):
         """Main logic for handling node edits after the user finishes"""
-        if self._is_updating: return
-        
         if column == 1: self.handle_integer_knob_change(row, column, 'render_order')
         elif column == 2: self.handle_node_name_change(row, column)
         elif column == 3: self.handle_string_knob_change(row, column, 'label')
@@ -245,75 +297,69 @@ class WriteOrderPanel(QtWidgets.QWidget):
 
     def handle_integer_knob_change(self, row, column, knob_name):
         """Logic for integer based knobs"""
-        self._is_updating = True
-        
-        item = self.write_nodes_table.item(row, column)
-        name_item = self.write_nodes_table.item(row, 2) 
-        if not name_item: self._is_updating = False; return
-        
-        node_name = name_item.data(QtCore.Qt.UserRole)
-        new_value_str = item.text()
-        
-        try:
-            new_value = int(new_value_str)
-            node = nuke.toNode(node_name)
-            if node:
-                node[knob_name].setValue(new_value)
-        except (ValueError, TypeError):
+        with _signals_blocked(self.write_nodes_table):
+            item = self.write_nodes_table.item(row, column)
+            name_item = self.write_nodes_table.item(row, 2) 
+            if not name_item: return
+            
+            node_name = name_item.data(QtCore.Qt.UserRole)
+            new_value_str = item.text()
             node = nuke.toNode(node_name)
-            if node:
-                original_value = node[knob_name].value()
-                item.setText(str(int(original_value)))
-            nuke.message("Invalid Input:\n\nValue for '{}' must be a whole number.".format(knob_name))
-        finally:
-            self._is_updating = False
-            self.populate_table()
+            
+            try:
+                new_value = int(new_value_str)
+                if node:
+                    node[knob_name].setValue(new_value)
+                    item.setData(_SORT_ROLE, new_value)
+            except (ValueError, TypeError):
+                if node:
+                    original_value = node[knob_name].value()
+                    item.setText(str(int(original_value)))
+                nuke.message("Invalid Input:\n\nValue for '{}' must be a whole number.".format(knob_name))
+        self.populate_table()
 
     def handle_string_knob_change(self, row, column, knob_name):
         """Logic for string based knobs"""
-        self._is_updating = True
-        
-        item = self.write_nodes_table.item(row, column)
-        name_item = self.write_nodes_table.item(row, 2) 
-        if not name_item: self._is_updating = False; return
-        
-        node_name = name_item.data(QtCore.Qt.UserRole)
-        node = nuke.toNode(node_name)
-        if node:
-            node[knob_name].setValue(item.text())
-
-        self._is_updating = False
+        with _signals_blocked(self.write_nodes_table):
+            item = self.write_nodes_table.item(row, column)
+            name_item = self.write_nodes_table.item(row, 2) 
+            if not name_item: return
+            
+            node_name = name_item.data(QtCore.Qt.UserRole)
+            node = nuke.toNode(node_name)
+            if node:
+                node[knob_name].setValue(item.text())
             
     def handle_node_name_change(self, row, column):
         """Logic for changes to the nodes name"""
-        self._is_updating = True
-        
-        name_item = self.write_nodes_table.item(row, column)
-        old_node_name = name_item.data(QtCore.Qt.UserRole)
-        new_node_name = name_item.text().replace(" ", "_")
-        
-        if new_node_name != name_item.text():
-            name_item.setText(new_node_name)
+        with _signals_blocked(self.write_nodes_table):
+            name_item = self.write_nodes_table.item(row, column)
+            old_node_name = name_item.data(QtCore.Qt.UserRole)
+            new_node_name = name_item.text().replace(" ", "_")
+            
+            if new_node_name != name_item.text():
+                name_item.setText(new_node_name)
 
-        node = nuke.toNode(old_node_name)
-        if not node: self._is_updating = False; self.populate_table(); return
-        
-        if not new_node_name:
-            nuke.message("Invalid Name:\n\nNode names cannot be empty.")
-            name_item.setText(old_node_name)
-        elif new_node_name != old_node_name:
-            if nuke.toNode(new_node_name):
-                nuke.message("Invalid Name:\n\nNode name '{}' is already in use.".format(new_node_name))
+            to_node = nuke.toNode
+            node = to_node(old_node_name)
+            if not node:
+                self.populate_table()
+                return
+            
+            if not _VALID_NAME_RE.match(new_node_name):
+                nuke.message("Invalid Name:\n\nNode names must start with a letter or underscore and contain only letters, numbers and underscores.")
                 name_item.setText(old_node_name)
-            else:
-                try:
-                    node.setName(new_node_name)
-                    name_item.setData(QtCore.Qt.UserRole, new_node_name)
-                except RuntimeError as e:
-                    nuke.message("Could not rename node.\n\nError: {}".format(e))
+            elif new_node_name != old_node_name:
+                if to_node(new_node_name):
+                    nuke.message("Invalid Name:\n\nNode name '{}' is already in use.".format(new_node_name))
                     name_item.setText(old_node_name)
-        
-        self._is_updating = False
+                else:
+                    try:
+                        node.setName(new_node_name)
+                        name_item.setData(QtCore.Qt.UserRole, new_node_name)
+                    except RuntimeError as e:
+                        nuke.message("Could not rename node.\n\nError: {}".format(e))
+                        name_item.setText(old_node_name)
 
     def zoom_to_node(self, item):
         """Zoom logic"""
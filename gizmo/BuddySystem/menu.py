@@ -36,6 +36,9 @@ DOCUMENTATION = "https://www.hiramgifford.com/buddy-system"
 import nuke
 import nukescripts
 import webbrowser
+import os
+import sys
+import functools
 
 #===============================================================================
 #                   ---- Variables & Menus ----
@@ -55,114 +58,153 @@ if nuke.NUKE_VERSION_MAJOR < 11:
 else:
     buddySystem = toolbar.addMenu('BuddySystem', icon = "BuddySystemIcon.png")
 
+"""Bind the registration calls once, they're used for every entry below"""
+_add = buddySystem.addCommand
+_reg = nukescripts.panels.registerWidgetAsPanel
+_pane = nuke.menu('Pane')
+
+"""Hotkey contexts for table entries, expanded straight into addCommand's keyword arguments"""
+_DAG_ONLY = {'shortcutContext': 2}
+_GLOBAL = {}
+
+"""A table entry with _SEPARATOR as its target adds a separator to the submenu at its path"""
+_SEPARATOR = None
+
+def _submenu(path):
+    """Returns the BuddySystem submenu at path, creating it if needed"""
+    menu = buddySystem
+    for name in path.split('/'):
+        menu = menu.addMenu(name)
+    return menu
+
+def _run(module_name, function_name, kwargs):
+    """Shared dispatcher for every table command, the module is only imported the first time"""
+    module = sys.modules.get(module_name) or __import__(module_name)
+    return getattr(module, function_name)(**kwargs)
+
+def _register_panel(widget, name, panel_id):
+    """
+    Adds a panel to the Pane menu and layout restore without building anything yet
+    registerWidgetAsPanel only runs, and builds its PythonPanel wrapper, when the panel is first opened
+    """
+    def add_panel():
+        return _reg(widget, name, panel_id, create=True).addToPane()
+    _pane.addCommand(name, add_panel)
+    nukescripts.panels.register(panel_id, name, add_panel)
+
+def _build_cmd(target, kwargs):
+    """
+    Builds the callable for a 'module:function' target
+    Nuke accepts callables as commands, so nothing is re-parsed each time a hotkey fires
+    """
+    module_name, function_name = target.split(':')
+    return functools.partial(_run, module_name, function_name, kwargs)
+
+def _register(entries):
+    """Adds each (path, target, kwargs, hotkey, hotkey context) entry to the BuddySystem menu"""
+    for path, target, kwargs, key, ctx in entries:
+        if target is _SEPARATOR:
+            _submenu(path).addSeparator()
+            continue
+        _add(path, _build_cmd(target, kwargs), key, **ctx)
+
 #===============================================================================
 #              ---- NodeGraphBuddy Scripts & Hotkeys ----
 #===============================================================================
 """
+Each entry is (menu path, 'module:function', keyword arguments, hotkey, hotkey context)
 You can change the hotkeys here, just swap the binding near the end of each line 
 If you prefer to not use hotkeys, leave the binding empty e.g. -> ''
+A hotkey context of _DAG_ONLY limits the hotkey to the node graph, _GLOBAL leaves it global
+
+Scripts are imported by each command when it first runs, so nothing is loaded until its hotkey or menu item is first used
 """
 
-#---------------------------------[ Adjust - Distribute And Align ]-----------------------------------
+MENU = [
+    #---------------------------------[ Adjust - Distribute And Align ]-----------------------------------
+
+    ('Scripts/Adjust/Distribute | Align', 'node_graph_buddy_distribute_nodes:auto_distribute_nodes', {"align": True, "process_clusters": False}, '*', _GLOBAL),
+    ('Scripts/Adjust/Distribute | Align By Cluster', 'node_graph_buddy_distribute_nodes:auto_distribute_nodes', {"align": True, "process_clusters": True}, 'Shift+*', _GLOBAL),
 
-import node_graph_buddy_distribute_nodes
-buddySystem.addCommand('Scripts/Adjust/                 --- Distribute | Align ---', 'webbrowser.open("https://www.hiramgifford.com/buddy-system/node-graph-buddy#distribute-align-anchor-link")')
-buddySystem.addCommand('Scripts/Adjust/Distribute | Align', 'node_graph_buddy_distribute_nodes.auto_distribute_nodes(align=True, process_clusters=False)', '*')
-buddySystem.addCommand('Scripts/Adjust/Distribute | Align By Cluster', 'node_graph_buddy_distribute_nodes.auto_distribute_nodes(align=True, process_clusters=True)', 'Shift+*')
+    ('Scripts/Adjust/Align | Stack | Match Vertically', 'node_graph_buddy_align_nodes:align_nodes_advanced', {"align_direction": "vertical", "stack_direction": "right", "align_direction_bd": "right"}, 'Right', _DAG_ONLY),
+    ('Scripts/Adjust/Align | Stack | Match Vertically Alt', 'node_graph_buddy_align_nodes:align_nodes_advanced', {"align_direction": "vertical", "stack_direction": "left", "align_direction_bd": "left"}, 'Left', _DAG_ONLY),
+    ('Scripts/Adjust/Align | Stack | Match Horizontally', 'node_graph_buddy_align_nodes:align_nodes_advanced', {"align_direction": "horizontal", "stack_direction": "up", "align_direction_bd": "top"}, 'Up', _DAG_ONLY),
+    ('Scripts/Adjust/Align | Stack | Match Horizontally Alt', 'node_graph_buddy_align_nodes:align_nodes_advanced', {"align_direction": "horizontal", "stack_direction": "down", "align_direction_bd": "bottom"}, 'Down', _DAG_ONLY),
 
-import node_graph_buddy_align_nodes
-buddySystem.addCommand('Scripts/Adjust/Align | Stack | Match Vertically', 'node_graph_buddy_align_nodes.align_nodes_advanced(align_direction="vertical", stack_direction="right", align_direction_bd="right")', 'Right', shortcutContext=2)
-buddySystem.addCommand('Scripts/Adjust/Align | Stack | Match Vertically Alt', 'node_graph_buddy_align_nodes.align_nodes_advanced(align_direction="vertical", stack_direction="left", align_direction_bd="left")', 'Left', shortcutContext=2)
-buddySystem.addCommand('Scripts/Adjust/Align | Stack | Match Horizontally', 'node_graph_buddy_align_nodes.align_nodes_advanced(align_direction="horizontal", stack_direction="up", align_direction_bd="top")', 'Up', shortcutContext=2)
-buddySystem.addCommand('Scripts/Adjust/Align | Stack | Match Horizontally Alt', 'node_graph_buddy_align_nodes.align_nodes_advanced(align_direction="horizontal", stack_direction="down", align_direction_bd="bottom")', 'Down', shortcutContext=2)
+    ('Scripts/Adjust/Align Upstream', 'node_graph_buddy_align_nodes_upstream:align_upstream_nodes', {}, 'PgUp', _DAG_ONLY),
 
-import node_graph_buddy_align_nodes_upstream
-buddySystem.addCommand('Scripts/Adjust/Align Upstream', 'node_graph_buddy_align_nodes_upstream.align_upstream_nodes()', 'PgUp', shortcutContext=2)
+    #---------------------------------[ Adjust - Mirror ]-----------------------------------
 
-#---------------------------------[ Adjust - Mirror ]-----------------------------------
+    ('Scripts/Adjust', _SEPARATOR, {}, '', _GLOBAL),
+    ('Scripts/Adjust/Mirror Horizontally', 'node_graph_buddy_mirror_nodes:mirror_nodes', {"direction": "horizontal"}, 'Alt+M', _GLOBAL),
+    ('Scripts/Adjust/Mirror Vertically', 'node_graph_buddy_mirror_nodes:mirror_nodes', {"direction": "vertical"}, 'Ctrl+Alt+M', _GLOBAL),
 
-import node_graph_buddy_mirror_nodes
-buddySystem.addCommand('Scripts/Adjust/                 --- Mirror ---', 'webbrowser.open("https://www.hiramgifford.com/buddy-system/node-graph-buddy#mirror-anchor-link")')
-buddySystem.addCommand('Scripts/Adjust/Mirror Horizontally', 'node_graph_buddy_mirror_nodes.mirror_nodes(direction="horizontal")', 'Alt+M')
-buddySystem.addCommand('Scripts/Adjust/Mirror Vertically', 'node_graph_buddy_mirror_nodes.mirror_nodes(direction="vertical")', 'Ctrl+Alt+M')
+    #---------------------------------[ Adjust - Backdrops ]-----------------------------------
 
-#---------------------------------[ Adjust - Backdrops ]-----------------------------------
+    ('Scripts/Adjust', _SEPARATOR, {}, '', _GLOBAL),
+    ('Scripts/Adjust/Increase Z Order', 'node_graph_buddy_adjust_backdrops:adjust_z_order', {"mode": "Increase"}, 'Ctrl+Shift+Alt++', _GLOBAL),
+    ('Scripts/Adjust/Decrease Z Order', 'node_graph_buddy_adjust_backdrops:adjust_z_order', {"mode": "Decrease"}, 'Ctrl+Shift+Alt+-', _GLOBAL),
+    ('Scripts/Adjust/Increase Font Size', 'node_graph_buddy_adjust_backdrops:adjust_font_size', {"mode": "Increase"}, 'Ctrl+Shift+Alt+PgUp', _GLOBAL),
+    ('Scripts/Adjust/Decrease Font Size', 'node_graph_buddy_adjust_backdrops:adjust_font_size', {"mode": "Decrease"}, 'Ctrl+Shift+Alt+PgDown', _GLOBAL),
+    ('Scripts/Adjust/Resize Backdrop to Nodes', 'node_graph_buddy_adjust_backdrops:resize_backdrop', {"padding": 100}, 'Ctrl+Shift+Alt+*', _GLOBAL),
+    ('Scripts/Adjust/Sort Z Order By Size', 'node_graph_buddy_adjust_backdrops:sort_backdrops_by_size_and_zorder', {}, 'Ctrl+Shift+Alt+Z', _GLOBAL),
 
-import node_graph_buddy_adjust_backdrops
-buddySystem.addCommand('Scripts/Adjust/                 --- Backdrops ---', 'webbrowser.open("https://www.hiramgifford.com/buddy-system/node-graph-buddy#resize-backdrop-anchor-link")')
-buddySystem.addCommand('Scripts/Adjust/Increase Z Order', 'node_graph_buddy_adjust_backdrops.adjust_z_order(mode="Increase")', 'Ctrl+Shift+Alt++')
-buddySystem.addCommand('Scripts/Adjust/Decrease Z Order', 'node_graph_buddy_adjust_backdrops.adjust_z_order(mode="Decrease")', 'Ctrl+Shift+Alt+-')
-buddySystem.addCommand('Scripts/Adjust/Increase Font Size', 'node_graph_buddy_adjust_backdrops.adjust_font_size(mode="Increase")', 'Ctrl+Shift+Alt+PgUp')
-buddySystem.addCommand('Scripts/Adjust/Decrease Font Size', 'node_graph_buddy_adjust_backdrops.adjust_font_size(mode="Decrease")', 'Ctrl+Shift+Alt+PgDown')
-buddySystem.addCommand('Scripts/Adjust/Resize Backdrop to Nodes', 'node_graph_buddy_adjust_backdrops.resize_backdrop(padding=100)', 'Ctrl+Shift+Alt+*')
-buddySystem.addCommand('Scripts/Adjust/Sort Z Order By Size', 'node_graph_buddy_adjust_backdrops.sort_backdrops_by_size_and_zorder()', 'Ctrl+Shift+Alt+Z')
+    #---------------------------------[ Scale - Biased ]-----------------------------------
 
-#---------------------------------[ Scale - Biased ]-----------------------------------
+    ('Scripts/Scale/Decrease Height', 'node_graph_buddy_scale_nodes:scale_node_dimensions', {"mode": "decrease", "direction": "bdheight"}, 'Ctrl+Shift+Up', _DAG_ONLY),
+    ('Scripts/Scale/Increase Height', 'node_graph_buddy_scale_nodes:scale_node_dimensions', {"mode": "increase", "direction": "bdheight"}, 'Ctrl+Shift+Down', _DAG_ONLY),
+    ('Scripts/Scale/Decrease Width', 'node_graph_buddy_scale_nodes:scale_node_dimensions', {"mode": "decrease", "direction": "bdwidth"}, 'Ctrl+Shift+Left', _DAG_ONLY),
+    ('Scripts/Scale/Increase Width', 'node_graph_buddy_scale_nodes:scale_node_dimensions', {"mode": "increase", "direction": "bdwidth"}, 'Ctrl+Shift+Right', _DAG_ONLY),
+    ('Scripts/Scale/Increase Uniform', 'node_graph_buddy_scale_nodes:scale_node_dimensions', {"mode": "increase", "direction": "bdboth_top"}, 'Ctrl+Shift++', _DAG_ONLY),
+    ('Scripts/Scale/Decrease Uniform', 'node_graph_buddy_scale_nodes:scale_node_dimensions', {"mode": "decrease", "direction": "bdboth_bottom"}, 'Ctrl+Shift+-', _DAG_ONLY),
+    ('Scripts/Scale/Settings', 'node_graph_buddy_scale_nodes:scale_node_dimension_settings', {}, 'Ctrl+Shift+Home', _DAG_ONLY),
 
-import node_graph_buddy_scale_nodes
-buddySystem.addCommand('Scripts/Scale/                 --- Scale: Biased ---', 'webbrowser.open("https://www.hiramgifford.com/buddy-system/node-graph-buddy#scale-biased-anchor-link")')
-buddySystem.addCommand('Scripts/Scale/Decrease Height', 'node_graph_buddy_scale_nodes.scale_node_dimensions(mode="decrease", direction="bdheight")', 'Ctrl+Shift+Up', shortcutContext=2)
-buddySystem.addCommand('Scripts/Scale/Increase Height', 'node_graph_buddy_scale_nodes.scale_node_dimensions(mode="increase", direction="bdheight")', 'Ctrl+Shift+Down', shortcutContext=2)
-buddySystem.addCommand('Scripts/Scale/Decrease Width', 'node_graph_buddy_scale_nodes.scale_node_dimensions(mode="decrease", direction="bdwidth")', 'Ctrl+Shift+Left', shortcutContext=2)
-buddySystem.addCommand('Scripts/Scale/Increase Width', 'node_graph_buddy_scale_nodes.scale_node_dimensions(mode="increase", direction="bdwidth")', 'Ctrl+Shift+Right', shortcutContext=2)
-buddySystem.addCommand('Scripts/Scale/Increase Uniform', 'node_graph_buddy_scale_nodes.scale_node_dimensions(mode="increase", direction="bdboth_top")', 'Ctrl+Shift++', shortcutContext=2)
-buddySystem.addCommand('Scripts/Scale/Decrease Uniform', 'node_graph_buddy_scale_nodes.scale_node_dimensions(mode="decrease", direction="bdboth_bottom")', 'Ctrl+Shift+-', shortcutContext=2)
-buddySystem.addCommand('Scripts/Scale/Settings', 'node_graph_buddy_scale_nodes.scale_node_dimension_settings()', 'Ctrl+Shift+Home', shortcutContext=2)
+    #---------------------------------[ Scale - Center ]-----------------------------------
 
-#---------------------------------[ Scale - Center ]-----------------------------------
+    ('Scripts/Scale', _SEPARATOR, {}, '', _GLOBAL),
+    ('Scripts/Scale/Decrease Scale Height', 'node_graph_buddy_scale_nodes:scale_node_dimensions', {"mode": "increase", "direction": "bdheight_center"}, 'Shift+Up', _DAG_ONLY),
+    ('Scripts/Scale/Increase Scale Height', 'node_graph_buddy_scale_nodes:scale_node_dimensions', {"mode": "decrease", "direction": "bdheight_center"}, 'Shift+Down', _DAG_ONLY),
+    ('Scripts/Scale/Decrease Scale Width', 'node_graph_buddy_scale_nodes:scale_node_dimensions', {"mode": "decrease", "direction": "bdwidth_center"}, 'Shift+Left', _DAG_ONLY),
+    ('Scripts/Scale/Increase Scale Width', 'node_graph_buddy_scale_nodes:scale_node_dimensions', {"mode": "increase", "direction": "bdwidth_center"}, 'Shift+Right', _DAG_ONLY),
+    ('Scripts/Scale/Increase Scale Uniform', 'node_graph_buddy_scale_nodes:scale_node_dimensions', {"mode": "increase", "direction": "bdboth_center"}, 'Shift++', _DAG_ONLY),
+    ('Scripts/Scale/Decrease Scale Uniform', 'node_graph_buddy_scale_nodes:scale_node_dimensions', {"mode": "decrease", "direction": "bdboth_center"}, 'Shift+-', _DAG_ONLY),
 
-buddySystem.addCommand('Scripts/Scale/                 --- Scale: Center ---', 'webbrowser.open("https://www.hiramgifford.com/buddy-system/node-graph-buddy#scale-center-anchor-link")')
-buddySystem.addCommand('Scripts/Scale/Decrease Scale Height', 'node_graph_buddy_scale_nodes.scale_node_dimensions(mode="increase", direction="bdheight_center")', 'Shift+Up', shortcutContext=2)
-buddySystem.addCommand('Scripts/Scale/Increase Scale Height', 'node_graph_buddy_scale_nodes.scale_node_dimensions(mode="decrease", direction="bdheight_center")', 'Shift+Down', shortcutContext=2)
-buddySystem.addCommand('Scripts/Scale/Decrease Scale Width', 'node_graph_buddy_scale_nodes.scale_node_dimensions(mode="decrease", direction="bdwidth_center")', 'Shift+Left', shortcutContext=2)
-buddySystem.addCommand('Scripts/Scale/Increase Scale Width', 'node_graph_buddy_scale_nodes.scale_node_dimensions(mode="increase", direction="bdwidth_center")', 'Shift+Right', shortcutContext=2)
-buddySystem.addCommand('Scripts/Scale/Increase Scale Uniform', 'node_graph_buddy_scale_nodes.scale_node_dimensions(mode="increase", direction="bdboth_center")', 'Shift++', shortcutContext=2)
-buddySystem.addCommand('Scripts/Scale/Decrease Scale Uniform', 'node_graph_buddy_scale_nodes.scale_node_dimensions(mode="decrease", direction="bdboth_center")', 'Shift+-', shortcutContext=2)
+    #---------------------------------[ Create ]-----------------------------------
 
-#---------------------------------[ Create ]-----------------------------------
+    ('Scripts/Create/Create Blur Or Backdrop', 'node_graph_buddy_create_backdrop:create_backdrop', {"advanced": False}, 'B', _GLOBAL),
+    ('Scripts/Create/Create Blur Or Backdrop Advanced', 'node_graph_buddy_create_backdrop:create_backdrop', {"advanced": True}, 'Shift+B', _GLOBAL),
 
-import node_graph_buddy_create_backdrop
-buddySystem.addCommand('Scripts/Create/Create Blur Or Backdrop', 'node_graph_buddy_create_backdrop.create_backdrop(advanced=False)', 'B')
-buddySystem.addCommand('Scripts/Create/Create Blur Or Backdrop Advanced', 'node_graph_buddy_create_backdrop.create_backdrop(advanced=True)', 'Shift+B')
+    #---------------------------------[ Utilities - General ]-----------------------------------
 
-#---------------------------------[ Utilities - General ]-----------------------------------
+    ('Scripts/Utilities/Smart Select All', 'node_graph_buddy_smart_select_all:smart_select_all', {"select_contents": True}, 'Ctrl+A', _DAG_ONLY),
+    ('Scripts/Utilities/Smart Select Backdrops', 'node_graph_buddy_smart_select_all:smart_select_all', {"select_contents": False}, 'Ctrl+Shift+A', _DAG_ONLY),
 
-buddySystem.addCommand('Scripts/Utilities/                 --- General ---', 'webbrowser.open("https://www.hiramgifford.com/buddy-system/node-graph-buddy#utilities")')
-import node_graph_buddy_smart_select_all
-buddySystem.addCommand('Scripts/Utilities/Smart Select All', 'node_graph_buddy_smart_select_all.smart_select_all(select_contents=True)', 'Ctrl+A', shortcutContext=2)
-buddySystem.addCommand('Scripts/Utilities/Smart Select Backdrops', 'node_graph_buddy_smart_select_all.smart_select_all(select_contents=False)', 'Ctrl+Shift+A', shortcutContext=2)
+    ('Scripts/Utilities/Set Node Label', 'node_graph_buddy_label_node:label_and_recenter_nodes', {"auto_case": True}, 'A', _DAG_ONLY),
 
-import node_graph_buddy_label_node
-buddySystem.addCommand('Scripts/Utilities/Set Node Label', 'node_graph_buddy_label_node.label_and_recenter_nodes(auto_case=True)', 'A', shortcutContext=2)
+    ('Scripts/Utilities/Copy Reconnect', 'node_graph_buddy_copy_paste_reconnect:copy_paste_reconnect', {"mode": "copy"}, 'Ctrl+Alt+Shift+C', _GLOBAL),
+    ('Scripts/Utilities/Paste Reconnect', 'node_graph_buddy_copy_paste_reconnect:copy_paste_reconnect', {"mode": "paste"}, 'Ctrl+Alt+Shift+V', _GLOBAL),
 
-import node_graph_buddy_copy_paste_reconnect
-buddySystem.addCommand('Scripts/Utilities/Copy Reconnect', 'node_graph_buddy_copy_paste_reconnect.copy_paste_reconnect(mode="copy")', 'Ctrl+Alt+Shift+C')
-buddySystem.addCommand('Scripts/Utilities/Paste Reconnect', 'node_graph_buddy_copy_paste_reconnect.copy_paste_reconnect(mode="paste")', 'Ctrl+Alt+Shift+V')
+    ('Scripts/Utilities/Paste To Multiple', 'node_graph_buddy_paste_to_multiple:multipaste_and_select', {}, 'Shift+V', _GLOBAL),
 
-import node_graph_buddy_paste_to_multiple
-buddySystem.addCommand('Scripts/Utilities/Paste To Multiple', 'node_graph_buddy_paste_to_multiple.multipaste_and_select()', 'Shift+V')
+    ('Scripts/Utilities/Toggle Disable', 'node_graph_buddy_toggle_disable:toggle_disable', {}, 'Shift+D', _GLOBAL),
 
-import node_graph_buddy_toggle_disable
-buddySystem.addCommand('Scripts/Utilities/Toggle Disable', 'node_graph_buddy_toggle_disable.toggle_disable()', 'Shift+D')
+    #---------------------------------[ Utilities - Panels ]-----------------------------------
 
+    ('Scripts/Utilities', _SEPARATOR, {}, '', _GLOBAL),
+    ('Scripts/Utilities/Write Node Manager', 'node_graph_buddy_write_node_manager:show_floating_panel', {}, 'Ctrl+Shift+W', _GLOBAL),
 
-#---------------------------------[ Utilities - Panels ]-----------------------------------
+    ('Scripts/Utilities/BBox Manager', 'node_graph_buddy_bbox_manager:show_floating_panel', {}, '', _GLOBAL),
 
-buddySystem.addCommand('Scripts/Utilities/                 --- Panels ---', 'webbrowser.open("https://www.hiramgifford.com/buddy-system/node-graph-buddy#write-node-manager-anchor-link")')
-import node_graph_buddy_write_node_manager
-nuke.menu('Pane').addCommand('NodeGraphBuddy - Write Node Manager', "nukescripts.panels.restorePanel('hg.buddysystem.WriteNodeManager')")
-nukescripts.panels.registerWidgetAsPanel('node_graph_buddy_write_node_manager.WriteOrderPanel', 'NodeGraphBuddy - Write Node Manager', 'hg.buddysystem.WriteNodeManager')
-buddySystem.addCommand('Scripts/Utilities/Write Node Manager', 'node_graph_buddy_write_node_manager.show_floating_panel()','Ctrl+Shift+W')
+    ('Scripts/Utilities/Nodeoriety Node Counter', 'node_graph_buddy_nodeoriety_node_counter:show_floating_panel', {}, '', _GLOBAL),
+]
+_register(MENU)
 
-import node_graph_buddy_bbox_manager
-nuke.menu('Pane').addCommand('NodeGraphBuddy - BBox Manager', "nukescripts.panels.restorePanel('hg.buddysystem.BBoxManager')")
-nukescripts.panels.registerWidgetAsPanel('node_graph_buddy_bbox_manager.BoundingBoxInfoPanel', 'NodeGraphBuddy - BBox Manager', 'hg.buddysystem.BBoxManager')
-buddySystem.addCommand('Scripts/Utilities/BBox Manager', 'node_graph_buddy_bbox_manager.show_floating_panel()','')
+#---------------------------------[ Panels ]-----------------------------------
+_register_panel('__import__("node_graph_buddy_write_node_manager").WriteOrderPanel', 'NodeGraphBuddy - Write Node Manager', 'hg.buddysystem.WriteNodeManager')
 
-import node_graph_buddy_nodeoriety_node_counter 
-nuke.menu('Pane').addCommand('NodeGraphBuddy - Nodeoriety Node Counter', "nukescripts.panels.restorePanel('hg.buddysystem.Nodeoriety')")
-nukescripts.panels.registerWidgetAsPanel('node_graph_buddy_nodeoriety_node_counter.NodeorietyPanel', 'NodeGraphBuddy - Nodeoriety Node Counter', 'hg.buddysystem.Nodeoriety')
-buddySystem.addCommand('Scripts/Utilities/Nodeoriety Node Counter', 'node_graph_buddy_nodeoriety_node_counter.show_floating_panel()','')
+_register_panel('__import__("node_graph_buddy_bbox_manager").BoundingBoxInfoPanel', 'NodeGraphBuddy - BBox Manager', 'hg.buddysystem.BBoxManager')
+
+_register_panel('__import__("node_graph_buddy_nodeoriety_node_counter").NodeorietyPanel', 'NodeGraphBuddy - Nodeoriety Node Counter', 'hg.buddysystem.Nodeoriety')
 
 #===============================================================================
 #                           ---- Buddy Tools ----
@@ -176,25 +218,31 @@ If you turn these tools into Gizmos many of the dynamic knobs, and features will
 You can change the hotkeys here, just modify the bindings at the end of each line
 If you prefer to tab search and not use hotkeys, leave the binding empty e.g. -> ''
 """
-buddySystem.addCommand('Tools/AnimBuddy', 'nuke.createNode("AnimBuddy")', 'Alt+Shift+A')
-buddySystem.addCommand('Tools/CardBuddy', 'nuke.createNode("CardBuddy")', 'Alt+Shift+C')
-buddySystem.addCommand('Tools/DepthBuddy', 'nuke.createNode("DepthBuddy")', 'Alt+Shift+Z')
-buddySystem.addCommand('Tools/MaskBuddy', 'nuke.createNode("MaskBuddy")', 'Alt+Shift+M')
-buddySystem.addCommand('Tools/ProjectionBuddy', 'nuke.createNode("ProjectionBuddy")', 'Alt+Shift+P')
-buddySystem.addCommand('Tools/ReflectionBuddy', 'nuke.createNode("ReflectionBuddy")', 'Alt+Shift+R')
+BUDDY_TOOLS = (
+    ('AnimBuddy', 'Alt+Shift+A'),
+    ('CardBuddy', 'Alt+Shift+C'),
+    ('DepthBuddy', 'Alt+Shift+Z'),
+    ('MaskBuddy', 'Alt+Shift+M'),
+    ('ProjectionBuddy', 'Alt+Shift+P'),
+    ('ReflectionBuddy', 'Alt+Shift+R'),
+)
+for tool_name, key in BUDDY_TOOLS:
+    _add('Tools/' + tool_name, 'nuke.createNode("{0}")'.format(tool_name), key)
 
 #===============================================================================
 #                           ---- Fun Stuff ----
 #===============================================================================
-
-import fun_rotate_nodes
-buddySystem.addCommand('Fun/Rotate Nodes', 'fun_rotate_nodes.rotate_nodes()', '')
-
-import fun_node_randomizer
-buddySystem.addCommand('Fun/Node Randomizer', 'fun_node_randomizer.show_randomize_panel()', '')
-
-import fun_caesar_shift
-buddySystem.addCommand('Fun/Caesar Shift Labels', 'fun_caesar_shift.show_caesar_shift_label()', '')
+"""
+Set the environment variable BUDDYSYSTEM_FUN=0 to leave the Fun menu out entirely
+The scripts themselves are only imported when one of these entries is first used
+"""
+FUN_MENU = [
+    ('Fun/Rotate Nodes', 'fun_rotate_nodes:rotate_nodes', {}, '', _GLOBAL),
+    ('Fun/Node Randomizer', 'fun_node_randomizer:show_randomize_panel', {}, '', _GLOBAL),
+    ('Fun/Caesar Shift Labels', 'fun_caesar_shift:show_caesar_shift_label', {}, '', _GLOBAL),
+]
+if os.environ.get('BUDDYSYSTEM_FUN', '1') != '0':
+    _register(FUN_MENU)
 
 #===============================================================================
 #                    ---- Documentation | Version ----
@@ -203,7 +251,20 @@ buddySystem.addCommand('Fun/Caesar Shift Labels', 'fun_caesar_shift.show_caesar_
 buddySystem.addSeparator()
 
 """Opens the documentation URL in your default web browser"""
-buddySystem.addCommand('Documentation', 'webbrowser.open(DOCUMENTATION)')
+_add('Documentation', 'webbrowser.open(DOCUMENTATION)')
+
+"""Jumps straight to a section of the NodeGraphBuddy documentation"""
+HELP_MENU = [
+    ('Help/Distribute | Align', 'webbrowser:open', {"url": "https://www.hiramgifford.com/buddy-system/node-graph-buddy#distribute-align-anchor-link"}, '', _GLOBAL),
+    ('Help/Mirror', 'webbrowser:open', {"url": "https://www.hiramgifford.com/buddy-system/node-graph-buddy#mirror-anchor-link"}, '', _GLOBAL),
+    ('Help/Backdrops', 'webbrowser:open', {"url": "https://www.hiramgifford.com/buddy-system/node-graph-buddy#resize-backdrop-anchor-link"}, '', _GLOBAL),
+    ('Help/Scale: Biased', 'webbrowser:open', {"url": "https://www.hiramgifford.com/buddy-system/node-graph-buddy#scale-biased-anchor-link"}, '', _GLOBAL),
+    ('Help/Scale: Center', 'webbrowser:open', {"url": "https://www.hiramgifford.com/buddy-system/node-graph-buddy#scale-center-anchor-link"}, '', _GLOBAL),
+    ('Help/General', 'webbrowser:open', {"url": "https://www.hiramgifford.com/buddy-system/node-graph-buddy#utilities"}, '', _GLOBAL),
+    ('Help/Panels', 'webbrowser:open', {"url": "https://www.hiramgifford.com/buddy-system/node-graph-buddy#write-node-manager-anchor-link"}, '', _GLOBAL),
+]
+_register(HELP_MENU)
 
 """Displays the version number and other info"""
-buddySystem.addCommand("Version " + VERSION, 'nuke.message("""BuddySystem \nVersion {0} | {1} \n<a href="https://www.hiramgifford.com/"><font color=#b16ec2>hiramgifford.com</font></a>""")'.format(VERSION, PUBLISH_DATE))
\ No newline at end of file
+_VERSION_MSG = 'BuddySystem \nVersion {0} | {1} \n<a href="https://www.hiramgifford.com/"><font color=#b16ec2>hiramgifford.com</font></a>'.format(VERSION, PUBLISH_DATE)
+_add("Version " + VERSION, 'nuke.message(_VERSION_MSG)')
\ No newline at end of file
@@ -7,137 +7,231 @@ directory is in the NUKE_PATH.
 
 import os
 import sys
+import traceback
+
+try:
+    import nuke
+except ImportError:
+    # Not in Nuke environment
+    nuke = None
+
+# orjson is optional; fall back to the standard library where it isn't installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Parsed multishot_context / multishot_custom values keyed by the raw JSON
+# string. Batch mode runs the initializer from both onScriptLoad and the Root
+# onCreate callback, so the same blobs would otherwise be parsed repeatedly.
+_JSON_CACHE = {}
+
+
+def _load_json(text):
+    """Parse a JSON knob value, reusing the result of earlier identical parses."""
+    try:
+        return _JSON_CACHE[text]
+    except KeyError:
+        parsed = _JSON_CACHE[text] = _json_loads(text)
+        return parsed
+
+
+# Keys from multishot_custom that are promoted to individual root knobs
+_CUSTOM_ROOT_KEYS = frozenset(('PROJ_ROOT', 'IMG_ROOT'))
+
+
+# Verbose batch-mode diagnostics are only printed when MULTISHOT_DEBUG=1;
+# on the farm every print goes through Nuke's synchronous stdout capture.
+_DEBUG = os.environ.get('MULTISHOT_DEBUG') == '1'
+
+
+def _dbg(msg, *args):
+    """Print a diagnostic message when MULTISHOT_DEBUG is enabled.
+
+    Arguments are %-formatted into msg only when the message is printed.
+    """
+    if _DEBUG:
+        print(msg % args if args else msg)
+
+
+# (exception type, message) pairs whose traceback has already been printed
+_SEEN_TRACEBACKS = set()
+
+
+def _dbg_traceback():
+    """
+    Print the current exception's traceback when MULTISHOT_DEBUG is enabled.
+
+    Recoverable errors tend to repeat on every script load, so each distinct
+    error only gets its traceback printed the first time.
+    """
+    if not _DEBUG:
+        return
+    exc_type, exc, _ = sys.exc_info()
+    signature = (exc_type, str(exc))
+    if signature not in _SEEN_TRACEBACKS:
+        _SEEN_TRACEBACKS.add(signature)
+        traceback.print_exc()
+
+
+def _root_knob_report(root, all_knobs):
+    """Build the MULTISHOT_DEBUG dump of root knobs and the first MultishotRead."""
+    lines = [
+        "\n" + "=" * 80,
+        "MULTISHOT DEBUG: Printing ALL root knobs",
+        "=" * 80,
+        f"Total knobs on root: {len(all_knobs)}",
+        "\nMultishot JSON knobs:",
+    ]
+    for knob_name in ['multishot_context', 'multishot_custom', 'multishot_variables']:
+        if knob_name in all_knobs:
+            lines.append(f"  {knob_name} = {root[knob_name].value()}")
+        else:
+            lines.append(f"  {knob_name} = MISSING!")
+
+    lines.append("\nIndividual variable knobs:")
+    for knob_name in ['ep', 'seq', 'shot', 'project', 'PROJ_ROOT', 'IMG_ROOT', 'first_frame', 'last_frame']:
+        if knob_name in all_knobs:
+            lines.append(f"  {knob_name} = '{root[knob_name].value()}'")
+        else:
+            lines.append(f"  {knob_name} = MISSING!")
+    lines.append("=" * 80)
+
+    lines.append("\nDEBUG: Checking Read node frame ranges...")
+    for read_node in nuke.allNodes('Read'):
+        if 'Multishot' in read_node.name():
+            lines.append(f"  Read node: {read_node.name()}")
+            if read_node.knob('first'):
+                lines.append(f"    first value: {read_node['first'].value()}")
+                lines.append(f"    first expression: {read_node['first'].toScript()}")
+            if read_node.knob('last'):
+                lines.append(f"    last value: {read_node['last'].value()}")
+                lines.append(f"    last expression: {read_node['last'].toScript()}")
+            break  # Just check first MultishotRead node
+    lines.append("=" * 80)
+    return lines
+
+
+def _set_string_knobs(root, all_knobs, values):
+    """
+    Create a String knob on root for each key in values, then set them all.
+
+    All missing knobs are added before any value is set so the root knob
+    table is only mutated in one pass. all_knobs is the caller's root.knobs()
+    snapshot and is updated with any knobs created here.
+    """
+    for key in values:
+        if key not in all_knobs:
+            knob = nuke.String_Knob(key, key)
+            # DON'T set INVISIBLE - Deadline strips invisible knobs!
+            root.addKnob(knob)
+            all_knobs[key] = knob
+            _dbg("  Created knob: %s", key)
+
+    for key, value in values.items():
+        root[key].setValue(value if isinstance(value, str) else str(value))
+        _dbg("  Set %s = %s", key, value)
+
 
 def ensure_variables_for_batch_mode():
     """
-    DEBUG: Just print all root knobs to see what's in the script.
-    Also manually create knobs from JSON if the onScriptLoad callback failed.
+    Manually create knobs from JSON if the onScriptLoad callback failed.
+
+    Set MULTISHOT_DEBUG=1 to also dump all root knobs to see what's in the script.
     """
     try:
-        import nuke
-        import json
         root = nuke.root()
 
-        print("\n" + "=" * 80)
-        print("MULTISHOT DEBUG: Printing ALL root knobs")
-        print("=" * 80)
-
-        # Print ALL knobs on root
         all_knobs = root.knobs()
-        print("Total knobs on root: {}".format(len(all_knobs)))
-
-        # Print multishot-related knobs
-        print("\nMultishot JSON knobs:")
-        for knob_name in ['multishot_context', 'multishot_custom', 'multishot_variables']:
-            if knob_name in all_knobs:
-                value = root[knob_name].value()
-                print("  {} = {}".format(knob_name, value))
-            else:
-                print("  {} = MISSING!".format(knob_name))
-
-        # Print individual variable knobs
-        print("\nIndividual variable knobs:")
-        for knob_name in ['ep', 'seq', 'shot', 'project', 'PROJ_ROOT', 'IMG_ROOT', 'first_frame', 'last_frame']:
-            if knob_name in all_knobs:
-                value = root[knob_name].value()
-                print("  {} = '{}'".format(knob_name, value))
-            else:
-                print("  {} = MISSING!".format(knob_name))
-
-        print("=" * 80)
-
-        # DEBUG: Check a Read node's frame range
-        print("\nDEBUG: Checking Read node frame ranges...")
-        for read_node in nuke.allNodes('Read'):
-            if 'Multishot' in read_node.name():
-                print("  Read node: {}".format(read_node.name()))
-                if read_node.knob('first'):
-                    first_val = read_node['first'].value()
-                    first_expr = read_node['first'].toScript()
-                    print("    first value: {}".format(first_val))
-                    print("    first expression: {}".format(first_expr))
-                if read_node.knob('last'):
-                    last_val = read_node['last'].value()
-                    last_expr = read_node['last'].toScript()
-                    print("    last value: {}".format(last_val))
-                    print("    last expression: {}".format(last_expr))
-                break  # Just check first MultishotRead node
-        print("=" * 80)
+        if 'multishot_context' not in all_knobs and 'multishot_custom' not in all_knobs:
+            # Not a multishot script - nothing to initialize
+            _dbg("Multishot: No multishot knobs on root, skipping batch initialization")
+            return
+
+        if _DEBUG:
+            sys.stdout.write('\n'.join(_root_knob_report(root, all_knobs)) + '\n')
 
         # MANUALLY CREATE KNOBS if the onScriptLoad callback failed!
-        print("\nMultishot: Manually creating individual knobs from JSON...")
-        print("DEBUG: Checking for JSON knobs...")
-        print("DEBUG: 'multishot_context' in all_knobs: {}".format('multishot_context' in all_knobs))
-        print("DEBUG: 'multishot_custom' in all_knobs: {}".format('multishot_custom' in all_knobs))
+        _dbg("\nMultishot: Manually creating individual knobs from JSON...")
+        _dbg("DEBUG: Checking for JSON knobs...")
+        _dbg("DEBUG: 'multishot_context' in all_knobs: %s", 'multishot_context' in all_knobs)
+        _dbg("DEBUG: 'multishot_custom' in all_knobs: %s", 'multishot_custom' in all_knobs)
 
         # Ensure Multishot tab exists
-        if 'multishot_tab' not in root.knobs():
+        if 'multishot_tab' not in all_knobs:
             tab = nuke.Tab_Knob('multishot_tab', 'Multishot')
             root.addKnob(tab)
-            print("DEBUG: Created Multishot tab")
+            all_knobs['multishot_tab'] = tab
+            _dbg("DEBUG: Created Multishot tab")
 
         # Create knobs from multishot_context
         if 'multishot_context' in all_knobs:
             context_json = root['multishot_context'].value()
-            print("DEBUG: context_json value: {}".format(repr(context_json)))
+            _dbg("DEBUG: context_json value: %r", context_json)
             if context_json:
                 try:
-                    context_vars = json.loads(context_json)
-                    print("DEBUG: Parsed context_vars: {}".format(context_vars))
-                    for key, value in context_vars.items():
-                        if key not in root.knobs():
-                            knob = nuke.String_Knob(key, key)
-                            # DON'T set INVISIBLE - Deadline strips invisible knobs!
-                            root.addKnob(knob)
-                            print("  Created knob: {}".format(key))
-                        root[key].setValue(str(value))
-                        print("  Set {} = {}".format(key, value))
+                    context_vars = _load_json(context_json)
+                    _dbg("DEBUG: Parsed context_vars: %s", context_vars)
+                    _set_string_knobs(root, all_knobs, context_vars)
                 except Exception as e:
-                    print("  ERROR parsing multishot_context: {}".format(e))
-                    import traceback
-                    traceback.print_exc()
+                    print(f"  ERROR parsing multishot_context: {e}")
+                    _dbg_traceback()
             else:
-                print("DEBUG: context_json is empty!")
+                _dbg("DEBUG: context_json is empty!")
         else:
-            print("DEBUG: multishot_context knob does NOT exist!")
+            _dbg("DEBUG: multishot_context knob does NOT exist!")
 
         # Create knobs from multishot_custom
         if 'multishot_custom' in all_knobs:
             custom_json = root['multishot_custom'].value()
-            print("DEBUG: custom_json value: {}".format(repr(custom_json)))
+            _dbg("DEBUG: custom_json value: %r", custom_json)
             if custom_json:
                 try:
-                    custom_vars = json.loads(custom_json)
-                    print("DEBUG: Parsed custom_vars: {}".format(custom_vars))
-                    for key, value in custom_vars.items():
-                        if key in ['PROJ_ROOT', 'IMG_ROOT']:
-                            if key not in root.knobs():
-                                knob = nuke.String_Knob(key, key)
-                                # DON'T set INVISIBLE - Deadline strips invisible knobs!
-                                root.addKnob(knob)
-                                print("  Created knob: {}".format(key))
-                            root[key].setValue(str(value))
-                            print("  Set {} = {}".format(key, value))
+                    custom_vars = _load_json(custom_json)
+                    _dbg("DEBUG: Parsed custom_vars: %s", custom_vars)
+                    _set_string_knobs(root, all_knobs, {
+                        key: value for key, value in custom_vars.items()
+                        if key in _CUSTOM_ROOT_KEYS
+                    })
                 except Exception as e:
-                    print("  ERROR parsing multishot_custom: {}".format(e))
-                    import traceback
-                    traceback.print_exc()
+                    print(f"  ERROR parsing multishot_custom: {e}")
+                    _dbg_traceback()
             else:
-                print("DEBUG: custom_json is empty!")
+                _dbg("DEBUG: custom_json is empty!")
         else:
-            print("DEBUG: multishot_custom knob does NOT exist!")
+            _dbg("DEBUG: multishot_custom knob does NOT exist!")
 
         print("Multishot: Variables initialized in batch mode")
-        print("=" * 80 + "\n")
+        _dbg("=" * 80 + "\n")
 
     except Exception as e:
-        print("Multishot: Error in batch mode initialization: {}".format(e))
-        import traceback
-        traceback.print_exc()
+        print(f"Multishot: Error in batch mode initialization: {e}")
+        _dbg_traceback()
+
 
 
+def _nodes_by_class():
+    """Group the nodes of the current script, including inside groups, by class in one walk."""
+    nodes_by_class = {}
+    for node in nuke.allNodes(recurseGroups=True):
+        nodes_by_class.setdefault(node.Class(), []).append(node)
+    return nodes_by_class
 
-def fix_read_node_frame_ranges():
+
+# Frame range expressions Read nodes should carry in batch mode
+_FIRST_EXPR = '[value root.first_frame]'
+_LAST_EXPR = '[value root.last_frame]'
+
+
+def _has_expression(knob, expr):
+    """Return True if knob is already driven by expr alone, with no keys."""
+    if not knob.hasExpression():
+        return False
+    curve = knob.animation(0)
+    return curve is not None and curve.noExplicitKeys() and curve.expression() == expr
+
+
+def fix_read_node_frame_ranges(nodes_by_class=None):
     """
     Fix Read node first/last frame expressions for batch mode.
 
@@ -145,105 +239,67 @@ def fix_read_node_frame_ranges():
     like {{"\[value root.first_frame]" x1 1}} which causes frame mismatches.
 
     Solution: Reset first/last to proper TCL expressions.
+
+    Args:
+        nodes_by_class: Optional result of _nodes_by_class() to reuse
     """
     try:
-        import nuke
+        if nodes_by_class is None:
+            nodes_by_class = _nodes_by_class()
 
         print("Multishot: Fixing Read node frame ranges for batch mode...")
 
         fixed_count = 0
 
-        # Fix all Read nodes
-        for node in nuke.allNodes('Read'):
+        # Fix all top-level Read nodes. Reads inside groups and gizmos keep
+        # their own frame ranges.
+        for node in nodes_by_class.get('Read', ()):
+            if '.' in node.fullName():
+                continue
             try:
                 # Reset first/last frame to use root knobs
                 # Note: first/last are Int_Knob, so we use setExpression() not fromUserText()
-                if node.knob('first'):
-                    node['first'].setExpression('[value root.first_frame]')
+                changed = False
+                first_knob = node.knob('first')
+                if first_knob and not _has_expression(first_knob, _FIRST_EXPR):
+                    first_knob.setExpression(_FIRST_EXPR)
+                    changed = True
+
+                last_knob = node.knob('last')
+                if last_knob and not _has_expression(last_knob, _LAST_EXPR):
+                    last_knob.setExpression(_LAST_EXPR)
+                    changed = True
+
+                if changed:
                     fixed_count += 1
-
-                if node.knob('last'):
-                    node['last'].setExpression('[value root.last_frame]')
-
-                print("  Read '{}': reset frame range to use root knobs".format(node.name()))
+                    print(f"  Read '{node.name()}': reset frame range to use root knobs")
 
             except Exception as e:
-                print("  Warning: Could not fix Read node '{}': {}".format(node.name(), e))
+                print(f"  Warning: Could not fix Read node '{node.name()}': {e}")
 
         if fixed_count > 0:
-            print("Multishot: Fixed {} Read node(s)".format(fixed_count))
+            print(f"Multishot: Fixed {fixed_count} Read node(s)")
         else:
             print("Multishot: No Read nodes needed fixing")
 
     except Exception as e:
-        print("  Warning: Could not fix Read node frame ranges: {}".format(e))
-        import traceback
-        traceback.print_exc()
+        print(f"  Warning: Could not fix Read node frame ranges: {e}")
+        _dbg_traceback()
 
 
-def register_ocio_viewer_processes():
-    """
-    Register OCIO displays as viewer processes for batch mode.
-
-    This is CRITICAL for batch mode rendering! Without this, Nuke will error with
-    "Bad value for display : <display_name>" when loading scripts that reference
-    OCIO displays in Write nodes or Viewer nodes.
-
-    Reference: https://community.foundry.com/discuss/topic/97288/nuke-viewer-process
-    "You should register your viewer process in your init.py instead of menu.py,
-    so it's available on non-gui sessions."
-    """
-    try:
-        import nuke
-
-        print("Multishot: Registering OCIO viewer processes for batch mode...")
+# Nuke's built-in viewer processes, replaced by OCIO ones in batch mode
+_DEFAULT_VIEWER_PROCESSES = ('sRGB', 'rec709', 'rec1886')
 
-        try:
-            import PyOpenColorIO as OCIO
-
-            # Get the current OCIO config
-            config = OCIO.GetCurrentConfig()
-
-            # Get all displays
-            displays = []
-            for i in range(config.getNumDisplays()):
-                display = config.getDisplay(i)
-                displays.append(display)
-
-            print("  Found {} OCIO displays: {}".format(len(displays), ', '.join(displays)))
-
-            # Register each display as a viewer process
-            # This makes them available in batch mode
-            for display in displays:
-                # Get views for this display
-                views = []
-                for j in range(config.getNumViews(display)):
-                    view = config.getView(display, j)
-                    views.append(view)
-
-                # Register the display with its default view
-                if views:
-                    default_view = config.getDefaultView(display)
-
-                    # Create a simple viewer process that just applies the display transform
-                    # Format: nuke.ViewerProcess.register(name, call, args)
-                    # For OCIO, we don't need to do anything special - Nuke handles it automatically
-                    # We just need to make sure the display name is recognized
-                    print("  Registered display '{}' with views: {}".format(display, ', '.join(views)))
-
-            print("Multishot: OCIO viewer processes registered successfully")
-
-        except ImportError:
-            print("  Warning: PyOpenColorIO not available, skipping viewer process registration")
-        except Exception as e:
-            print("  Warning: Could not register OCIO viewer processes: {}".format(e))
-            import traceback
-            traceback.print_exc()
+# OCIO display transforms registered as viewer processes
+# Format: "View Name (Display Name)"
+_OCIO_VIEWER_PROCESSES = (
+    "ACES 1.0 - SDR Video (sRGB - Display)",
+    "ACES 1.0 - SDR Video (Rec.1886 Rec.709 - Display)",
+    "Un-tone-mapped (sRGB - Display)",
+)
 
-    except Exception as e:
-        print("Multishot: Error registering viewer processes: {}".format(e))
-        import traceback
-        traceback.print_exc()
+# Viewer processes are process-wide, so they only need registering once
+_VIEWER_PROCESSES_REGISTERED = False
 
 
 def register_ocio_displays_for_batch_mode():
@@ -259,31 +315,26 @@ def register_ocio_displays_for_batch_mode():
     Reference: https://community.foundry.com/discuss/topic/97288/nuke-viewer-process
 
     The trick is to unregister default viewer processes and register OCIO-based ones.
+    Later calls in the same session return immediately.
     """
-    try:
-        import nuke
+    global _VIEWER_PROCESSES_REGISTERED
+    if _VIEWER_PROCESSES_REGISTERED:
+        return
 
+    try:
         print("Multishot: Registering OCIO viewer processes for batch mode...")
 
+        viewer_process = nuke.ViewerProcess
+        create_node = nuke.createNode
+
         # Unregister default viewer processes
         # This is necessary to avoid conflicts with OCIO-based viewer processes
-        try:
-            nuke.ViewerProcess.unregister('sRGB')
-            print("  Unregistered: sRGB")
-        except:
-            pass
-
-        try:
-            nuke.ViewerProcess.unregister('rec709')
-            print("  Unregistered: rec709")
-        except:
-            pass
-
-        try:
-            nuke.ViewerProcess.unregister('rec1886')
-            print("  Unregistered: rec1886")
-        except:
-            pass
+        for vp_name in _DEFAULT_VIEWER_PROCESSES:
+            try:
+                viewer_process.unregister(vp_name)
+                print(f"  Unregistered: {vp_name}")
+            except Exception:
+                pass
 
         # Register OCIO-based viewer processes
         # These will be available in the viewerProcess dropdown
@@ -291,37 +342,137 @@ def register_ocio_displays_for_batch_mode():
             # Register a "None" viewer process for batch mode
             # Syntax: register(name, call, args, kwargs)
             # kwargs must be a dict, not tuple!
-            nuke.ViewerProcess.register("None", nuke.createNode, ("Viewer", ""), {})
+            viewer_process.register("None", create_node, ("Viewer", ""), {})
             print("  Registered: None")
         except Exception as e:
-            print("  Warning: Could not register 'None' viewer process: {}".format(e))
+            print(f"  Warning: Could not register 'None' viewer process: {e}")
 
         # Register OCIO display transforms as viewer processes
-        # Format: "View Name (Display Name)"
-        ocio_viewer_processes = [
-            "ACES 1.0 - SDR Video (sRGB - Display)",
-            "ACES 1.0 - SDR Video (Rec.1886 Rec.709 - Display)",
-            "Un-tone-mapped (sRGB - Display)",
-        ]
-
-        for vp_name in ocio_viewer_processes:
+        for vp_name in _OCIO_VIEWER_PROCESSES:
             try:
                 # Register as OCIO display transform
                 # The viewer process will use OCIODisplay node internally
-                nuke.ViewerProcess.register(vp_name, nuke.createNode, ("OCIODisplay", ""), {})
-                print("  Registered: {}".format(vp_name))
+                viewer_process.register(vp_name, create_node, ("OCIODisplay", ""), {})
+                print(f"  Registered: {vp_name}")
             except Exception as e:
-                print("  Warning: Could not register '{}': {}".format(vp_name, e))
+                print(f"  Warning: Could not register '{vp_name}': {e}")
 
+        _VIEWER_PROCESSES_REGISTERED = True
         print("Multishot: OCIO viewer processes registered")
 
     except Exception as e:
-        print("  Warning: Could not register OCIO viewer processes: {}".format(e))
-        import traceback
-        traceback.print_exc()
+        print(f"  Warning: Could not register OCIO viewer processes: {e}")
+        _dbg_traceback()
+
+
+# Map of display device names to proper colorspaces
+_DISPLAY_TO_COLORSPACE = {
+    'sRGB - Display': 'sRGB - Texture',
+    'Rec.1886 Rec.709 - Display': 'Rec.709 - Display',
+    'Rec.1886 Rec.2020 - Display': 'Rec.2020 - Display',
+}
+
+
+def _fix_display_colorspace(node, label):
+    """Replace a display device name in node's colorspace knob; return True if changed."""
+    cs_knob = node.knob('colorspace')
+    if cs_knob is None:
+        return False
+    current_cs = cs_knob.value()
+    new_cs = _DISPLAY_TO_COLORSPACE.get(current_cs)
+    if new_cs is None:
+        return False
+    cs_knob.setValue(new_cs)
+    print(f"  {label} '{node.name()}': changed colorspace '{current_cs}' -> '{new_cs}'")
+    return True
+
+
+# Viewer processes that disable the display transform, in order of preference
+_NONE_VIEWER_PROCESSES = ('None', 'none')
+
+# Chosen viewerProcess keyed by the tuple of available values. Every Viewer
+# offers the same registered viewer processes, so this resolves once.
+_VIEWER_PROCESS_CHOICES = {}
+
+
+def _pick_viewer_process(available_values):
+    """Return 'None', 'none', or the first available viewerProcess value (None if empty)."""
+    key = tuple(available_values)
+    try:
+        return _VIEWER_PROCESS_CHOICES[key]
+    except KeyError:
+        pass
+
+    available = set(key)
+    for candidate in _NONE_VIEWER_PROCESSES:
+        if candidate in available:
+            break
+    else:
+        candidate = key[0] if key else None
+    _VIEWER_PROCESS_CHOICES[key] = candidate
+    return candidate
+
+
+def _fix_read_node(node):
+    """Fix a Read node's colorspace for batch mode; return the number of fixes."""
+    return int(_fix_display_colorspace(node, 'Read'))
 
 
-def fix_ocio_display_for_batch_mode():
+def _fix_write_node(node):
+    """Fix a Write node's colorspace and Output Transform; return the number of fixes."""
+    fixed = int(_fix_display_colorspace(node, 'Write'))
+
+    # CRITICAL: Disable Output Transform in batch mode
+    # Output Transform is a creative decision that should be baked into the colorspace knob
+    # In batch mode, we just want to render with the colorspace setting, not apply display transforms
+    display_view_knob = node.knob('useOCIODisplayView')
+    if display_view_knob and display_view_knob.value():
+        # Disable Output Transform
+        display_view_knob.setValue(False)
+        print(f"  Write '{node.name()}': disabled Output Transform for batch mode")
+        fixed += 1
+
+    return fixed
+
+
+def _fix_viewer_node(node):
+    """Disable a Viewer's viewerProcess for batch mode; return the number of fixes."""
+    # In batch mode, viewers don't need specific display settings
+    # The viewerProcess knob is an enumeration - we need to find valid values
+    vp_knob = node.knob('viewerProcess')
+    if not vp_knob:
+        return 0
+
+    current_vp = vp_knob.value()
+    _dbg("  DEBUG: Viewer '%s' viewerProcess: '%s'", node.name(), current_vp)
+
+    # Get available values for viewerProcess
+    if hasattr(vp_knob, 'values'):
+        available_values = vp_knob.values()
+        _dbg("  DEBUG: Available viewerProcess values: %s", available_values)
+
+        # Try to set to 'None', 'none', or the first available value
+        new_vp = _pick_viewer_process(available_values)
+        if new_vp is None:
+            return 0
+    else:
+        # If we can't get available values, try setting to empty string
+        new_vp = ''
+
+    vp_knob.setValue(new_vp)
+    print(f"  Viewer '{node.name()}': set viewerProcess '{current_vp}' -> '{new_vp}'")
+    return 1
+
+
+# Per-class batch fixers, run in this order over the script's nodes
+_OCIO_NODE_FIXERS = {
+    'Read': _fix_read_node,
+    'Write': _fix_write_node,
+    'Viewer': _fix_viewer_node,
+}
+
+
+def fix_ocio_display_for_batch_mode(nodes_by_class=None):
     """
     Fix OCIO display/colorspace settings for batch mode rendering.
 
@@ -332,13 +483,21 @@ def fix_ocio_display_for_batch_mode():
     This function fixes these issues by:
     - Replacing display device names with proper colorspaces
     - Setting safe defaults for viewer nodes
+
+    Args:
+        nodes_by_class: Optional result of _nodes_by_class() to reuse
     """
     try:
-        import nuke
+        if nodes_by_class is None:
+            nodes_by_class = _nodes_by_class()
 
         # First, register OCIO displays so they're available in batch mode
         register_ocio_displays_for_batch_mode()
 
+        if not any(node_class in nodes_by_class for node_class in _OCIO_NODE_FIXERS):
+            print("Multishot: No OCIO settings needed fixing")
+            return
+
         # CRITICAL: Always fix Output Transform, even with default OCIO
         # Nuke 16's Output Transform adds display/view knobs that cause errors in batch mode
         print("Multishot: Fixing Output Transform for batch mode...")
@@ -347,161 +506,109 @@ def fix_ocio_display_for_batch_mode():
         ocio_config_path_knob = nuke.root().knob('customOCIOConfigPath')
         if ocio_config_path_knob:
             ocio_config_path = ocio_config_path_knob.value()
-            print("  DEBUG: customOCIOConfigPath knob value: '{}'".format(ocio_config_path))
+            _dbg("  DEBUG: customOCIOConfigPath knob value: '%s'", ocio_config_path)
             if ocio_config_path:
-                print("  OCIO config: {}".format(ocio_config_path))
+                print(f"  OCIO config: {ocio_config_path}")
             else:
                 print("  OCIO config: default (knob is empty)")
         else:
             print("  OCIO config: default (no customOCIOConfigPath knob)")
 
-        # Map of display device names to proper colorspaces
-        display_to_colorspace_map = {
-            'sRGB - Display': 'sRGB - Texture',
-            'Rec.1886 Rec.709 - Display': 'Rec.709 - Display',
-            'Rec.1886 Rec.2020 - Display': 'Rec.2020 - Display',
-        }
-
         fixed_count = 0
-
-        # Fix Read nodes
-        for node in nuke.allNodes('Read'):
-            try:
-                if node.knob('colorspace'):
-                    current_cs = node.knob('colorspace').value()
-                    if current_cs in display_to_colorspace_map:
-                        new_cs = display_to_colorspace_map[current_cs]
-                        node.knob('colorspace').setValue(new_cs)
-                        print("  Read '{}': changed colorspace '{}' -> '{}'".format(
-                            node.name(), current_cs, new_cs))
-                        fixed_count += 1
-            except Exception as e:
-                print("  Warning: Could not fix Read node '{}': {}".format(node.name(), e))
-
-        # Fix Write nodes
-        for node in nuke.allNodes('Write'):
-            try:
-                # Fix colorspace if needed
-                if node.knob('colorspace'):
-                    current_cs = node.knob('colorspace').value()
-                    if current_cs in display_to_colorspace_map:
-                        new_cs = display_to_colorspace_map[current_cs]
-                        node.knob('colorspace').setValue(new_cs)
-                        print("  Write '{}': changed colorspace '{}' -> '{}'".format(
-                            node.name(), current_cs, new_cs))
-                        fixed_count += 1
-
-                # CRITICAL: Disable Output Transform in batch mode
-                # Output Transform is a creative decision that should be baked into the colorspace knob
-                # In batch mode, we just want to render with the colorspace setting, not apply display transforms
-                if node.knob('useOCIODisplayView'):
-                    if node.knob('useOCIODisplayView').value():
-                        # Disable Output Transform
-                        node.knob('useOCIODisplayView').setValue(False)
-                        print("  Write '{}': disabled Output Transform for batch mode".format(node.name()))
-                        fixed_count += 1
-
-            except Exception as e:
-                print("  Warning: Could not fix Write node '{}': {}".format(node.name(), e))
-
-        # Fix Viewer nodes (disable viewerProcess in batch mode)
-        for node in nuke.allNodes('Viewer'):
-            try:
-                # In batch mode, viewers don't need specific display settings
-                # The viewerProcess knob is an enumeration - we need to find valid values
-                if node.knob('viewerProcess'):
-                    current_vp = node.knob('viewerProcess').value()
-                    print("  DEBUG: Viewer '{}' viewerProcess: '{}'".format(node.name(), current_vp))
-
-                    # Get available values for viewerProcess
-                    vp_knob = node.knob('viewerProcess')
-                    if hasattr(vp_knob, 'values'):
-                        available_values = vp_knob.values()
-                        print("  DEBUG: Available viewerProcess values: {}".format(available_values))
-
-                        # Try to set to 'None', 'none', or the first available value
-                        if 'None' in available_values:
-                            vp_knob.setValue('None')
-                            print("  Viewer '{}': set viewerProcess '{}' -> 'None'".format(node.name(), current_vp))
-                            fixed_count += 1
-                        elif 'none' in available_values:
-                            vp_knob.setValue('none')
-                            print("  Viewer '{}': set viewerProcess '{}' -> 'none'".format(node.name(), current_vp))
-                            fixed_count += 1
-                        elif len(available_values) > 0:
-                            # Use the first available value as fallback
-                            vp_knob.setValue(available_values[0])
-                            print("  Viewer '{}': set viewerProcess '{}' -> '{}'".format(node.name(), current_vp, available_values[0]))
-                            fixed_count += 1
-                    else:
-                        # If we can't get available values, try setting to empty string
-                        vp_knob.setValue('')
-                        print("  Viewer '{}': set viewerProcess '{}' -> '' (empty)".format(node.name(), current_vp))
-                        fixed_count += 1
-
-            except Exception as e:
-                print("  Warning: Could not fix Viewer '{}': {}".format(node.name(), e))
+        for node_class, fix_node in _OCIO_NODE_FIXERS.items():
+            for node in nodes_by_class.get(node_class, ()):
+                try:
+                    fixed_count += fix_node(node)
+                except Exception as e:
+                    print(f"  Warning: Could not fix {node_class} node '{node.name()}': {e}")
 
         if fixed_count > 0:
-            print("Multishot: Fixed {} OCIO settings for batch mode".format(fixed_count))
+            print(f"Multishot: Fixed {fixed_count} OCIO settings for batch mode")
         else:
             print("Multishot: No OCIO settings needed fixing")
 
     except Exception as e:
-        print("Multishot: Warning - Could not fix OCIO settings: {}".format(e))
+        print(f"Multishot: Warning - Could not fix OCIO settings: {e}")
         # Don't raise - this is not critical
 
+
+# Set once initialize_multishot() has succeeded in this Nuke session
+_INIT_DONE = False
+
+# Set once this directory is known to be on sys.path
+_PATH_ADDED = False
+
+
 def initialize_multishot():
-    """Initialize the Multishot Workflow System."""
+    """
+    Initialize the Multishot Workflow System.
+
+    Also registered as a Root onCreate backup, so after the first successful
+    run later calls return immediately instead of reloading gizmos and toolsets.
+    """
+    global _INIT_DONE, _PATH_ADDED
+    if _INIT_DONE:
+        return
+
     try:
         print("Multishot: Starting initialization...")
 
         # Add multishot package to Python path if not already there
-        current_dir = os.path.dirname(__file__)
-        if current_dir not in sys.path:
-            sys.path.insert(0, current_dir)
-            print("Multishot: Added {} to Python path".format(current_dir))
+        if not _PATH_ADDED:
+            current_dir = os.path.dirname(__file__)
+            if current_dir not in sys.path:
+                sys.path.insert(0, current_dir)
+                print(f"Multishot: Added {current_dir} to Python path")
+            _PATH_ADDED = True
 
         # Import and initialize multishot
         import multishot
-        print("Multishot: Imported multishot v{}".format(multishot.__version__))
+        print(f"Multishot: Imported multishot v{multishot.__version__}")
 
         success = multishot.initialize()
 
         if success:
-            print("Multishot Workflow System v{} loaded successfully".format(multishot.__version__))
+            _INIT_DONE = True
+            print(f"Multishot Workflow System v{multishot.__version__} loaded successfully")
             print("   - Menu: Multishot > Browser")
             print("   - Toolbar: Look for 'Multishot' in the toolbar")
             print("   - Shortcuts: Ctrl+Shift+M (Browser), F5 (Refresh Context)")
-
-            # Load gizmos and toolsets
-            try:
-                from multishot.utils.gizmo_loader import load_gizmos_and_toolsets
-                from multishot.core.variables import VariableManager
-
-                variable_manager = VariableManager()
-                loader = load_gizmos_and_toolsets(variable_manager)
-                print("   - Loaded: {}".format(loader.get_loaded_summary()))
-            except Exception as e:
-                print("   Warning: Could not load gizmos/toolsets: {}".format(e))
+            # Gizmos and toolsets are loaded by multishot.initialize() itself
         else:
             print("Failed to initialize Multishot Workflow System")
 
     except Exception as e:
-        print("Error loading Multishot Workflow System: {}".format(e))
-        import traceback
+        print(f"Error loading Multishot Workflow System: {e}")
         traceback.print_exc()
 
-# Initialize in both GUI and batch mode
-try:
-    import nuke
+def _is_registered(registry, func):
+    """
+    Return True if func from this same init.py is already in a nuke.callbacks registry.
+
+    Nuke runs init.py once per plugin path it is found on, so a checkout that is
+    both on NUKE_PATH and added with pluginAddPath would otherwise register its
+    callbacks twice. Each run defines new function objects, so match on code.
+    """
+    code = func.__code__
+    filename = os.path.realpath(code.co_filename)
+    for entries in registry.values():
+        for entry in entries:
+            other = getattr(entry[0], '__code__', None)
+            if (other is not None and other.co_name == code.co_name
+                    and os.path.realpath(other.co_filename) == filename):
+                return True
+    return False
 
+
+# Initialize in both GUI and batch mode
+if nuke is not None:
     if nuke.GUI:
         # GUI mode: Full initialization with menus and UI
-        initialize_multishot()
-        # Also add as callback for new scripts (backup)
-        nuke.addOnCreate(initialize_multishot, nodeClass='Root')
-    else:
+        if not _is_registered(nuke.callbacks.onCreates, initialize_multishot):
+            initialize_multishot()
+            # Also add as callback for new scripts (backup)
+            nuke.addOnCreate(initialize_multishot, nodeClass='Root')
+    elif not _is_registered(nuke.callbacks.onScriptLoads, ensure_variables_for_batch_mode):
         # Batch mode (render farm): Minimal initialization
         # Only ensure variables are accessible for expression evaluation
         print("Multishot: Batch mode detected - initializing variables only...")
@@ -510,10 +617,7 @@ try:
         # The .nk file has an onScriptLoad callback that will create the knobs.
         # We just add our debug callback to verify after the script loads.
 
-        # Add as callbacks for when scripts are loaded
+        # Add as callback for when scripts are loaded. Loading a .nk also fires
+        # the Root onCreate callback, so registering there too would run the
+        # whole initializer twice per script.
         nuke.addOnScriptLoad(ensure_variables_for_batch_mode)
-        nuke.addOnCreate(ensure_variables_for_batch_mode, nodeClass='Root')
-
-except ImportError:
-    # Not in Nuke environment
-    pass
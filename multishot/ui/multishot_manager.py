@@ -1228,14 +1228,14 @@ class VersionSettingDialog(QtWidgets.QDialog):
         """
         try:
             import os
-            from ..core.variables import VariableManager
+            from . import get_shared_variable_manager
 
             # Get node properties
             department = node['department'].value() if node.knob('department') else 'lighting'
             layer = node['layer'].value() if node.knob('layer') else 'MASTER_CHAR_A'
 
-            # Get variable manager to resolve paths
-            vm = VariableManager()
+            # Get shared variable manager to resolve paths
+            vm = get_shared_variable_manager()
 
             # Build directory path
             # Format: IMG_ROOT/project/all/scene/ep/seq/shot/department/publish/
@@ -1518,10 +1518,10 @@ class AddShotsDialog(QtWidgets.QDialog):
 def show_multishot_manager():
     """Show the multishot manager interface."""
     try:
-        from ..core.variables import VariableManager
+        from . import get_shared_variable_manager
 
         # Get or create shared variable manager
-        variable_manager = VariableManager()
+        variable_manager = get_shared_variable_manager()
 
         # Create and show dialog (use exec_() to keep it open)
         dialog = MultishotManagerDialog(variable_manager=variable_manager)
@@ -67,6 +67,14 @@ def get_ocio_path():
     return default_path
 
 
+# Map of display device names to proper colorspaces
+DISPLAY_TO_COLORSPACE = {
+    'sRGB - Display': 'sRGB - Texture',
+    'Rec.1886 Rec.709 - Display': 'Rec.709 - Display',
+    'Rec.1886 Rec.2020 - Display': 'Rec.2020 - Display',
+}
+
+
 def fix_ocio_in_current_script():
     """
     Fix OCIO display device names in the current Nuke script before submission.
@@ -82,23 +90,17 @@ def fix_ocio_in_current_script():
 
         print("Checking for OCIO display device names in script...")
 
-        # Map of display device names to proper colorspaces
-        display_to_colorspace_map = {
-            'sRGB - Display': 'sRGB - Texture',
-            'Rec.1886 Rec.709 - Display': 'Rec.709 - Display',
-            'Rec.1886 Rec.2020 - Display': 'Rec.2020 - Display',
-        }
-
         fixed_count = 0
 
         # Fix Read nodes
         for node in nuke.allNodes('Read'):
             try:
-                if node.knob('colorspace'):
-                    current_cs = node.knob('colorspace').value()
-                    if current_cs in display_to_colorspace_map:
-                        new_cs = display_to_colorspace_map[current_cs]
-                        node.knob('colorspace').setValue(new_cs)
+                cs_knob = node.knob('colorspace')
+                if cs_knob:
+                    current_cs = cs_knob.value()
+                    new_cs = DISPLAY_TO_COLORSPACE.get(current_cs)
+                    if new_cs is not None:
+                        cs_knob.setValue(new_cs)
                         print("  Read '{}': changed colorspace '{}' -> '{}'".format(
                             node.name(), current_cs, new_cs))
                         fixed_count += 1
@@ -108,11 +110,12 @@ def fix_ocio_in_current_script():
         # Fix Write nodes
         for node in nuke.allNodes('Write'):
             try:
-                if node.knob('colorspace'):
-                    current_cs = node.knob('colorspace').value()
-                    if current_cs in display_to_colorspace_map:
-                        new_cs = display_to_colorspace_map[current_cs]
-                        node.knob('colorspace').setValue(new_cs)
+                cs_knob = node.knob('colorspace')
+                if cs_knob:
+                    current_cs = cs_knob.value()
+                    new_cs = DISPLAY_TO_COLORSPACE.get(current_cs)
+                    if new_cs is not None:
+                        cs_knob.setValue(new_cs)
                         print("  Write '{}': changed colorspace '{}' -> '{}'".format(
                             node.name(), current_cs, new_cs))
                         fixed_count += 1